@@ -5,11 +5,16 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-import pytz
 import yaml
-from pytz import UnknownTimeZoneError
-from voluptuous import Any, Coerce, Required, Schema, Url
+from voluptuous import Any, Boolean, Coerce, Required, Schema, Url
+
+try:
+    from yaml import CFullLoader as FullLoader
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import FullLoader, SafeLoader  # type: ignore[assignment]
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -17,11 +22,58 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
-class Loader(yaml.SafeLoader):  # pylint: disable=too-many-ancestors
-    """Custom YAML loader."""
+_HOMEASSISTANT_SCHEMA = Schema(
+    {
+        Required("type"): "homeassistant",
+        Required("entity_id"): str,
+        Required("url"): Url,
+        Required("token"): str,
+        Required("name"): str,
+    }
+)
+_CLEAROUTSIDE_SCHEMA = Schema({Required("type"): "clearoutside", Required("name"): str})
+
+# configuration schema, compiled once at import instead of on every load
+CONFIG_SCHEMA = Schema(
+    {
+        Required("general"): {
+            Required("weather"): {
+                Required("sources"): [Any(_HOMEASSISTANT_SCHEMA, _CLEAROUTSIDE_SCHEMA)],
+                Required("max_forecast_days"): Coerce(int),
+            },
+            Required("location"): {
+                Required("latitude"): float,
+                Required("longitude"): float,
+                Required("altitude"): Coerce(float),
+                Required("timezone"): str,
+            },
+        },
+        Required("plant"): [
+            {
+                Required("name"): str,
+                Required("inverter"): str,
+                Required("microinverter"): Boolean(),
+                Required("arrays"): [
+                    {
+                        Required("name"): str,
+                        Required("tilt"): Coerce(float),
+                        Required("azimuth"): Coerce(float),
+                        Required("modules_per_string"): int,
+                        Required("strings"): int,
+                        Required("module"): str,
+                    }
+                ],
+            }
+        ],
+    }
+)
+
+
+class Loader(SafeLoader):  # pylint: disable=too-many-ancestors
+    """Custom YAML loader, backed by libyaml when available."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigReader:
     """Reads PV plant configuration from a YAML file."""
 
@@ -30,41 +82,67 @@ class ConfigReader:
     config_file_path: Path = field(repr=True)
     secrets_file_path: Path | None = field(repr=True, default=None)
 
+    _config_mtimes: tuple[int, int | None] = field(init=False, repr=False)
+    _loader: type[Loader] = field(init=False, repr=False)
+
     def __post_init__(self) -> None:
         """Initialize the class."""
         if not self.config_file_path.exists():
             msg = f"Configuration file {self.config_file_path} not found."
             raise FileNotFoundError(msg)
 
-        # load the main configuration file
-        with self.config_file_path.open(encoding="utf-8") as config_file:
-            # load secrets file and add loader for secrets
-            try:
-                if self.secrets_file_path is not None:
-                    self._load_secrets_file()
-                    Loader.add_constructor("!secret", self._yaml_secrets_loader)
-                    config = next(yaml.load_all(config_file, Loader=Loader))
-                else:
-                    config = yaml.safe_load(config_file)
-                    _LOGGER.info("No secrets file loaded")
-
-                # validate the configuration
-                Schema(self._config_schema)(config)
-            except yaml.YAMLError as exc:
-                msg = f"Error parsing configuration file {self.config_file_path}. Did you forget to include --secrets?"
-                _LOGGER.exception(msg)
-                raise yaml.YAMLError(msg) from exc
+        # register the !secret constructor once, on a loader private to this instance
+        # so readers with different secrets files do not overwrite each other
+        self._loader = type("SecretLoader", (Loader,), {})
+        self._loader.add_constructor("!secret", self._yaml_secrets_loader)
+        self._load_config()
+
+    def _load_config(self) -> None:
+        """Parse and validate the YAML configuration file."""
+        # record the mtimes before reading, a file changed during the parse is then
+        # parsed again on the next access instead of being cached as up to date
+        mtimes = self._file_mtimes()
+
+        # load the main configuration file, libyaml decodes the raw bytes itself
+        config_data = self.config_file_path.read_bytes()
+
+        # load secrets file and add loader for secrets
+        try:
+            if self.secrets_file_path is not None:
+                self._load_secrets_file()
+                config = next(yaml.load_all(config_data, Loader=self._loader))
+            else:
+                config = yaml.load(config_data, Loader=SafeLoader)
+                _LOGGER.info("No secrets file loaded")
+
+            # validate the configuration and keep the coerced result
+            config = CONFIG_SCHEMA(config)
+        except yaml.YAMLError as exc:
+            msg = f"Error parsing configuration file {self.config_file_path}. Did you forget to include --secrets?"
+            _LOGGER.exception(msg)
+            raise yaml.YAMLError(msg) from exc
 
         # check if the timezone is valid
         try:
-            config["general"]["location"]["timezone"] = pytz.timezone(
+            config["general"]["location"]["timezone"] = ZoneInfo(
                 config["general"]["location"]["timezone"]
             )
-        except UnknownTimeZoneError as exc:
+        except (ZoneInfoNotFoundError, ValueError) as exc:
             msg = f"Unknown timezone {config['general']['location']['timezone']}"
-            raise UnknownTimeZoneError(msg) from exc
+            raise ZoneInfoNotFoundError(msg) from exc
 
         self._config = config
+        self._config_mtimes = mtimes
+
+    def _file_mtimes(self) -> tuple[int, int | None]:
+        """Get the modification times of the configuration and secrets files.
+
+        :return: Tuple of config and secrets file mtimes in ns, None if there are no secrets.
+        """
+        secrets_mtime = None
+        if self.secrets_file_path is not None:
+            secrets_mtime = self.secrets_file_path.stat().st_mtime_ns
+        return self.config_file_path.stat().st_mtime_ns, secrets_mtime
 
     def _yaml_secrets_loader(self, loader: yaml.SafeLoader, node: yaml.Node) -> Any:
         """Load secrets from the secrets file.
@@ -99,63 +177,20 @@ class ConfigReader:
             msg = f"Secrets file {self.secrets_file_path} not found."
             raise FileNotFoundError(msg)
 
-        with self.secrets_file_path.open(encoding="utf-8") as secrets_file:
-            self._secrets = yaml.full_load(secrets_file)
+        secrets_data = self.secrets_file_path.read_bytes()
+        self._secrets = yaml.load(secrets_data, Loader=FullLoader)  # noqa: S506
 
     @property
     def config(self) -> dict[str, Any]:
         """Parse the YAML configuration and return it as a dictionary.
 
+        The parsed configuration is cached and only parsed again when the configuration
+        or secrets file changed on disk. Objects built from an earlier configuration,
+        such as the webserver's PV system manager and weather sources, are not rebuilt.
+
         :return: The configuration as a dictionary.
         """
+        if self._file_mtimes() != self._config_mtimes:
+            _LOGGER.info("Reloading changed configuration %s", self.config_file_path)
+            self._load_config()
         return self._config
-
-    @property
-    def _config_schema(self) -> Schema:
-        """Get the configuration schema as a Schema object.
-
-        :return: Config schema.
-        """
-        homessistant = Schema(
-            {
-                Required("type"): "homeassistant",
-                Required("entity_id"): str,
-                Required("url"): Url,
-                Required("token"): str,
-                Required("name"): str,
-            }
-        )
-        clearoutside = Schema({Required("type"): "clearoutside", Required("name"): str})
-        return Schema(
-            {
-                Required("general"): {
-                    Required("weather"): {
-                        Required("sources"): [Any(homessistant, clearoutside)],
-                        Required("max_forecast_days"): Coerce(int),
-                    },
-                    Required("location"): {
-                        Required("latitude"): float,
-                        Required("longitude"): float,
-                        Required("altitude"): Coerce(float),
-                        Required("timezone"): str,
-                    },
-                },
-                Required("plant"): [
-                    {
-                        Required("name"): str,
-                        Required("inverter"): str,
-                        Required("microinverter"): Coerce(bool),
-                        Required("arrays"): [
-                            {
-                                Required("name"): str,
-                                Required("tilt"): Coerce(float),
-                                Required("azimuth"): Coerce(float),
-                                Required("modules_per_string"): int,
-                                Required("strings"): int,
-                                Required("module"): str,
-                            }
-                        ],
-                    }
-                ],
-            }
-        )
@@ -1,10 +1,17 @@
 """Program global constants."""
 from __future__ import annotations
 
+import importlib.util
 from typing import Any
 
 DT_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
 
+# pvlib computes solar positions with a numba compiled SPA when numba is installed.
+# Use one method everywhere, pvlib reloads its SPA module whenever the method changes.
+SOLAR_POSITION_METHOD = (
+    "nrel_numba" if importlib.util.find_spec("numba") is not None else "nrel_numpy"
+)
+
 
 LOG_FORMAT = "%(asctime)s [%(levelname)8s] %(message)s (%(name)s:%(lineno)s)"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import re
 import secrets
 import typing
 from dataclasses import InitVar, dataclass, field
+from types import MappingProxyType
 
+import orjson
 from voluptuous import All, Coerce, MultipleInvalid, Range, Required, Schema
 from websockets.sync.client import Connection, connect  # type: ignore[attr-defined]
 
 _LOGGER = logging.getLogger(__name__)
 
+# Home Assistant entity ids have the form <domain>.<object_id>
+ENTITY_ID_PATTERN = re.compile(r"^[a-z0-9_]+\.[a-z0-9_]+\Z")
+
 
 forecast_item_schema = Schema(
     {
@@ -51,14 +56,15 @@ class HomeAssistantAPI:
     token: InitVar[str]
     entity_id: str
     _hass_url: str = field(init=False, repr=False)
-    _auth_headers: dict[str, str] = field(default_factory=dict, init=False, repr=False)
-    _data_headers: dict[str, str | int | float] = field(
-        default_factory=dict, init=False, repr=False
+    _auth_headers: MappingProxyType[str, str] = field(init=False, repr=False)
+    _data_headers: MappingProxyType[str, str | int | float] = field(
+        init=False, repr=False
     )
+    _auth_message: str = field(default="", init=False, repr=False)
 
     def __post_init__(self, host: str, token: str) -> None:
         """Initialize the Home Assistant API interface."""
-        if len(self.entity_id.split(".")) != 2:
+        if not ENTITY_ID_PATTERN.match(self.entity_id):
             msg = "Invalid entity_id: %s. Must use format 'weather.<name>'"
             raise ValueError(msg)
         if not self.entity_id.startswith("weather."):
@@ -70,16 +76,24 @@ class HomeAssistantAPI:
         self._hass_url = f"ws://{host_stripped}/api/websocket"
         _LOGGER.debug("Initializing HA API at %s", self._hass_url)
 
-        self._auth_headers = {
+        # the headers are built once and exposed read-only
+        auth_headers = {
             "type": "auth",
             "access_token": token,
         }
-        self._data_headers = {
-            "id": -1,
-            "type": "weather/subscribe_forecast",
-            "entity_id": self.entity_id,
-            "forecast_type": "hourly",
-        }
+        self._auth_headers = MappingProxyType(auth_headers)
+        self._data_headers = MappingProxyType(
+            {
+                "id": -1,
+                "type": "weather/subscribe_forecast",
+                "entity_id": self.entity_id,
+                "forecast_type": "hourly",
+            }
+        )
+
+        # the auth message never changes, serialize it once. Decode to str, HA expects
+        # text frames and websockets sends bytes as binary frames
+        self._auth_message = orjson.dumps(auth_headers).decode()
 
     @property
     def url(self) -> str:
@@ -93,27 +107,22 @@ class HomeAssistantAPI:
             return self._authenticate(websocket)
 
     @property
-    def data_headers(self) -> dict[str, str | int]:
-        """Return the data headers."""
-        return {
-            "id": secrets.randbelow(100000),
-            "type": "weather/subscribe_forecast",
-            "entity_id": self.entity_id,
-            "forecast_type": "hourly",
-        }
+    def data_headers(self) -> dict[str, str | int | float]:
+        """Return the data headers with a fresh message id."""
+        return {**self._data_headers, "id": secrets.randbelow(100000)}
 
     def _authenticate(self, websocket: Connection) -> bool:
         """Authenticate with the Home Assistant API.
 
         Returns True if authentication was successful, False otherwise.
         """
-        reply = json.loads(websocket.recv())
+        reply = orjson.loads(websocket.recv())
         _LOGGER.debug("Received auth reply from HA: %s", reply)
         if reply["type"] != "auth_required":
             _LOGGER.error("Auth failed. Reply: %s", reply)
             return False
-        websocket.send(json.dumps(self._auth_headers))
-        reply = json.loads(websocket.recv())
+        websocket.send(self._auth_message)
+        reply = orjson.loads(websocket.recv())
         _LOGGER.debug("Received: %s", reply)
         if reply["type"] != "auth_ok":
             _LOGGER.error("Auth failed. Reply: %s", reply)
@@ -126,10 +135,10 @@ class HomeAssistantAPI:
         _LOGGER.info("Requesting data from %s", self._hass_url)
         with connect(self._hass_url) as websocket:
             self._authenticate(websocket)
-            websocket.send(json.dumps(self.data_headers))
+            websocket.send(orjson.dumps(self.data_headers).decode())
 
             # first reply: {..., 'success': True, 'result': None}
-            status: dict[str, bool | typing.Any] = json.loads(websocket.recv())
+            status: dict[str, bool | typing.Any] = orjson.loads(websocket.recv())
             if not status.get("success", False):
                 _LOGGER.error("Data request failed. Reply: %s", status)
                 msg = "Data request failed"
@@ -137,7 +146,7 @@ class HomeAssistantAPI:
 
             # second reply contains the forecast data, using the format:
             # {..., 'event': {'type': 'hourly', 'forecast': [{x}, {x}, ...]}}
-            reply: dict[str, bool | typing.Any] = json.loads(websocket.recv())
+            reply: dict[str, bool | typing.Any] = orjson.loads(websocket.recv())
             if not isinstance(reply, dict):
                 _LOGGER.error("Data request failed. Reply: %s", reply)
                 msg = "Data request failed"
@@ -1,12 +1,28 @@
 """Constants used throughout the model."""
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 CWD = Path(__file__).parent.parent.absolute()
 BASE_CEC_DATA_PATH = CWD / "data/proc"
 
-VALID_UPSAMPLE_FREQ = ("1h", "60m", "30m", "15m", "5m", "1m")
+# Parquet copies of the CEC databases are cached per user, the package itself may be
+# installed read-only
+CEC_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "pvcast"
+)
+
+# valid upsample frequencies mapped to their length in seconds
+UPSAMPLE_FREQ_SECONDS = {
+    "1h": 3_600,
+    "60m": 3_600,
+    "30m": 1_800,
+    "15m": 900,
+    "5m": 300,
+    "1m": 60,
+}
+VALID_UPSAMPLE_FREQ = tuple(UPSAMPLE_FREQ_SECONDS)
 VALID_DOWN_SAMPLE_FREQ = ("h", "d", "w", "mo", "y")
 
 SECONDS_PER_HOUR = 3_600
@@ -17,6 +33,8 @@ SECONDS_PER_HOUR = 3_600
 HISTORICAL_YEAR_MAPPING = 2021
 PVGIS_TMY_START = 2005
 PVGIS_TMY_END = 2015
+PVGIS_ATTEMPTS = 3
+PVGIS_TIMEOUT = 30  # seconds
 
 # model attribute constants
 CLEARSKY_MODEL_ATTRS: dict[str, str] = {
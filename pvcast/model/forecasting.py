@@ -5,39 +5,65 @@ from __future__ import annotations
 import copy
 import datetime as dt
 import logging
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 import polars as pl
+import requests
 from pvlib.atmosphere import gueymard94_pw
 from pvlib.iotools import get_pvgis_tmy
+from pvlib.modelchain import ModelChainResult
 
-from pvcast.const import DT_FORMAT
+from pvcast.const import SOLAR_POSITION_METHOD
 
 from .const import (
     CLEARSKY_MODEL_ATTRS,
     HISTORICAL_MODEL_ATTRS,
     HISTORICAL_YEAR_MAPPING,
     LIVE_MODEL_ATTRS,
+    PVGIS_ATTEMPTS,
+    PVGIS_TIMEOUT,
     PVGIS_TMY_END,
     PVGIS_TMY_START,
     SECONDS_PER_HOUR,
+    UPSAMPLE_FREQ_SECONDS,
     VALID_DOWN_SAMPLE_FREQ,
     VALID_UPSAMPLE_FREQ,
 )
 
 if TYPE_CHECKING:
     from pvlib.location import Location
+    from pvlib.modelchain import ModelChain
 
     from .model import PVPlantModel
 
 
 _LOGGER = logging.getLogger(__name__)
 
+# columns that together determine whether a row has any irradiance
+_IRRADIANCE_COLUMNS = ["ghi", "dni", "dhi"]
+
+# serializes PVGIS downloads per data file so plants at the same location retrieve
+# the data once, while plants at other locations are not blocked
+_PVGIS_LOCKS: defaultdict[Path, threading.Lock] = defaultdict(threading.Lock)
+_PVGIS_LOCKS_LOCK = threading.Lock()
+
+# shared by all forecasts so that running model chains does not start new threads
+_MODEL_CHAIN_EXECUTOR = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="pvcast_model_chain"
+)
+
 
 class ForecastType(str, Enum):
     """Enum for the type of PVPlantResults."""
@@ -54,7 +80,7 @@ MODEL_ATTRS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class ForecastResult:
     """Object to store the aggregated results of the PVPlantModel simulation.
 
@@ -104,13 +130,13 @@ class ForecastResult:
             msg = "No AC power data available. Run simulation first."
             raise ValueError(msg)
 
-        # copy the ForecastResult object
-        fc_result_cpy = copy.deepcopy(self)
+        # shallow copy, polars frames are immutable and ac_power is replaced below
+        fc_result_cpy = copy.copy(self)
         current_freq: int = fc_result_cpy.frequency
-        target_freq: int = fc_result_cpy.time_str_to_seconds(freq)
+        target_freq: int = UPSAMPLE_FREQ_SECONDS[freq]
 
         if current_freq < target_freq:
-            msg = f"Cannot upsample to a lower frequency. Current frequency is {fc_result_cpy.frequency}s."
+            msg = f"Cannot upsample to a lower frequency. Current frequency is {current_freq}s."
             raise ValueError(msg)
         if current_freq == target_freq:
             return fc_result_cpy
@@ -147,19 +173,6 @@ class ForecastResult:
         interval: dt.timedelta = intervals.item()
         return interval.seconds
 
-    def time_str_to_seconds(self, time_str: str) -> int:
-        """Convert a time string to seconds."""
-        if time_str.endswith("s"):
-            return int(time_str[:-1])
-        if time_str.endswith("m"):
-            return int(time_str[:-1]) * 60
-        if time_str.endswith("h"):
-            return int(time_str[:-1]) * 60 * 60
-        if time_str.endswith("d"):
-            return int(time_str[:-1]) * 60 * 60 * 24
-        msg = f"Invalid time string: {time_str}."
-        raise ValueError(msg)
-
     def energy(self, freq: str = "1d") -> pl.DataFrame:
         """Calculate the AC energy output of the PV plant.
 
@@ -177,13 +190,14 @@ class ForecastResult:
             msg = f"Invalid frequency suffix. Must be one of {VALID_DOWN_SAMPLE_FREQ}."
             raise ValueError(msg)
 
-        # check data frequency
-        if self.frequency > SECONDS_PER_HOUR:
-            msg = f"Cannot calculate energy for data with frequency {self.frequency}s. Must be <= 1H."
+        # check data frequency, inferring it scans the datetime column so do it once
+        frequency = self.frequency
+        if frequency > SECONDS_PER_HOUR:
+            msg = f"Cannot calculate energy for data with frequency {frequency}s. Must be <= 1H."
             raise ValueError(msg)
 
         # compute the conversion factor from power to energy
-        conversion_factor = self.frequency / SECONDS_PER_HOUR
+        conversion_factor = frequency / SECONDS_PER_HOUR
         ac_energy: pl.DataFrame = self.ac_power.select(
             pl.col("datetime"), pl.col("ac_power") * conversion_factor
         )
@@ -196,6 +210,37 @@ class ForecastResult:
         )
 
 
+def _daylight_mask(weather_df: pd.DataFrame) -> np.ndarray | None:
+    """Get the rows of the weather data that have any irradiance.
+
+    :param weather_df: The weather data to use for the simulation.
+    :return: Boolean mask of the rows with irradiance, or None if the irradiance is \
+        missing or incomplete and every row has to be simulated.
+    """
+    if not set(_IRRADIANCE_COLUMNS).issubset(weather_df.columns):
+        return None
+    irradiance = weather_df[_IRRADIANCE_COLUMNS].to_numpy(dtype=np.float64)
+    if np.isnan(irradiance).any():
+        return None
+    return (irradiance > 0).any(axis=1)
+
+
+def _night_ac_power(model_chain: ModelChain) -> float:
+    """Get the AC power output of a model chain without DC input.
+
+    This is the night consumption (tare) of the inverter as modelled by the AC model of
+    the model chain, e.g. -Pnt for the Sandia inverter model.
+
+    :param model_chain: The model chain.
+    :return: The AC power output in Watts.
+    """
+    system = model_chain.system
+    ac_model = model_chain.ac_model.__name__.removesuffix("_inverter")
+    zeros = np.zeros(1)
+    dc_input = tuple(zeros for _ in system.arrays) if system.num_arrays > 1 else zeros
+    return float(np.asarray(system.get_ac(ac_model, dc_input, dc_input))[0])
+
+
 @dataclass
 class PowerEstimate(ABC):
     """Abstract base class to do PV power estimation."""
@@ -205,11 +250,37 @@ class PowerEstimate(ABC):
     fc_type: ForecastType = field(default=ForecastType.LIVE)
     _result: ForecastResult | None = field(repr=False, default=None)
     _model_attrs: dict[str, str] = field(repr=False, default_factory=dict, init=False)
+    _model_chains: list[ModelChain] = field(
+        repr=False, default_factory=list, init=False
+    )
+    _chain_weights: np.ndarray = field(
+        repr=False, default_factory=lambda: np.ones(0), init=False
+    )
+    _night_power: float = field(repr=False, default=0.0, init=False)
+    _run_lock: threading.Lock = field(
+        repr=False, default_factory=threading.Lock, init=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Post init method."""
         self._model_attrs = MODEL_ATTRS[self.fc_type]
 
+        # each forecast type builds its own model chains once, so forecast types never
+        # change each other's models or results. The microinverters of one array share
+        # their PVSystem and produce identical output, simulate each system once and
+        # weigh its output by the number of inverters it models.
+        self._model_chains = [
+            self.pv_plant.create_model_chain(system, **self._model_attrs)
+            for system, _ in self.pv_plant.pv_systems
+        ]
+        self._chain_weights = np.array(
+            [count for _, count in self.pv_plant.pv_systems], dtype=np.float64
+        )
+        self._night_power = float(
+            self._chain_weights
+            @ np.array([_night_ac_power(mc) for mc in self._model_chains])
+        )
+
     def run(self, weather_df: pl.DataFrame | None = None) -> ForecastResult:
         """Run power estimate and store results.
 
@@ -230,29 +301,65 @@ class PowerEstimate(ABC):
         )
         result_df = result_df.with_columns(pl.col("datetime").str.to_datetime())
 
-        for model_chain in self.pv_plant.models:
-            # set the model chain attributes to the values specified in the subclass
-            for attr, val in self._model_attrs.items():
-                setattr(model_chain, attr, val)
-
-            # run the model chain
-            model_chain.run_model(weather_df_pd)
-
-            # add the results to the results DataFrame
-            ac: pl.Series = pl.from_pandas(model_chain.results.ac, include_index=False)  # type: ignore[assignment]
-            result_df = result_df.with_columns(ac.alias(model_chain.name))
-
-        # sum the results of all model chains horizontally and return the ForecastResult
-        results = result_df.select("datetime").with_columns(
-            result_df.select(pl.exclude("datetime"))
-            .sum_horizontal()
-            .cast(pl.Int64)
-            .alias("ac_power")
-        )
+        # without any irradiance the output of a PV system is the night consumption of
+        # its inverters, so only the rows with irradiance (daytime) need to be simulated
+        daylight = _daylight_mask(weather_df_pd)
+
+        # the model chains store their results on themselves, so concurrent runs of this
+        # forecast type must not share them
+        with self._run_lock:
+            if daylight is None:
+                ac_power = self._run_model_chains(weather_df_pd)
+            else:
+                ac_power = np.full(len(weather_df_pd), self._night_power)
+                if daylight.any():
+                    ac_power[daylight] = self._run_model_chains(weather_df_pd[daylight])
+
+        results = result_df.with_columns(pl.Series("ac_power", ac_power).cast(pl.Int64))
         return ForecastResult(
             name=self.pv_plant.name, fc_type=self.fc_type, ac_power=results
         )
 
+    def _run_model_chains(self, weather_df: pd.DataFrame) -> np.ndarray:
+        """Run all model chains of this forecast type and sum their AC power output.
+
+        :param weather_df: The weather data to use for the simulation.
+        :return: The summed AC power output of the PV plant.
+        """
+        # run the model chains, these are independent so with more than one (e.g. one
+        # per array) they are simulated concurrently
+        models = self._model_chains
+        if len(models) > 1:
+            ac_results = list(
+                _MODEL_CHAIN_EXECUTOR.map(
+                    partial(self._run_model_chain, weather_df=weather_df), models
+                )
+            )
+        else:
+            ac_results = [self._run_model_chain(mc, weather_df) for mc in models]
+
+        # sum the weighted results of all model chains with a single matrix-vector
+        # product on the stacked arrays, missing values count as no output
+        stacked_results = np.nan_to_num(np.vstack(ac_results), copy=False)
+        return self._chain_weights @ stacked_results
+
+    def _run_model_chain(
+        self, model_chain: ModelChain, weather_df: pd.DataFrame
+    ) -> np.ndarray:
+        """Run a single model chain of this forecast type.
+
+        :param model_chain: The model chain to run.
+        :param weather_df: The weather data to use for the simulation.
+        :return: The AC power output of the model chain.
+        """
+        model_chain.run_model(weather_df)
+        ac_power = model_chain.results.ac.to_numpy(dtype=np.float64)  # type: ignore[union-attr]
+
+        # only the AC power is used, release the intermediate results (solar position,
+        # irradiance, temperatures, DC output) instead of keeping them until the next run
+        model_chain.results = ModelChainResult()
+        return ac_power
+
     @abstractmethod
     def _prepare_weather(self, weather_df: pl.DataFrame | None = None) -> pl.DataFrame:
         """Prepare weather data for the forecast. This method should be implemented by subclasses.
@@ -265,7 +372,7 @@ class PowerEstimate(ABC):
         """
 
     @staticmethod
-    def _add_precipitable_water(
+    def add_precipitable_water(
         weather_df: pl.DataFrame,
         temp_col: str = "temperature",
         rh_col: str = "humidity",
@@ -313,7 +420,47 @@ class Live(PowerEstimate):
         if weather_df is None:
             msg = "Must provide weather data."
             raise ValueError(msg)
-        return self._add_precipitable_water(weather_df)
+        return self.add_precipitable_water(weather_df)
+
+
+def _compute_clearsky_irradiance(
+    location: Location, times: pd.DatetimeIndex
+) -> pl.DataFrame:
+    """Compute the clear sky irradiance at a location.
+
+    :param location: The location to compute the clear sky irradiance for.
+    :param times: The datetimes to compute the clear sky irradiance for.
+    :return: The clear sky irradiance with columns ghi, dni and dhi.
+    """
+    solpos = location.get_solarposition(times, method=SOLAR_POSITION_METHOD)
+    return pl.from_pandas(location.get_clearsky(times, solar_position=solpos))
+
+
+@lru_cache(maxsize=8)
+def _clearsky_irradiance(
+    location: Location,
+    start: dt.datetime,
+    end: dt.datetime,
+    freq: dt.timedelta,
+    tz: str | None,
+) -> pl.DataFrame:
+    """Compute the clear sky irradiance at a location for a range of datetimes.
+
+    All PV plants share the location of the PVSystemManager and are usually run for
+    the same datetimes, so the result is cached. The range is cheap to hash, the
+    datetimes are only built on a cache miss.
+
+    :param location: The location to compute the clear sky irradiance for.
+    :param start: First datetime of the range, naive UTC if tz is set.
+    :param end: Last datetime of the range (inclusive), naive UTC if tz is set.
+    :param freq: Step between the datetimes.
+    :param tz: Time zone of the datetimes, None for naive datetimes.
+    :return: The clear sky irradiance with columns ghi, dni and dhi.
+    """
+    times = pd.date_range(start, end, freq=freq)
+    if tz is not None:
+        times = times.tz_localize("UTC").tz_convert(tz)
+    return _compute_clearsky_irradiance(location, times)
 
 
 @dataclass
@@ -327,56 +474,142 @@ class Clearsky(PowerEstimate):
             msg = "Must provide weather data."
             raise ValueError(msg)
 
-        # convert datetimes to a format that pvlib can handle
-        dt_strings = pd.DatetimeIndex(weather_df["datetime"].dt.strftime(DT_FORMAT))
-        cs = pl.from_pandas(self.location.get_clearsky(dt_strings))
+        # regularly spaced datetimes are described by their range, which is cached
+        datetimes = weather_df["datetime"]
+        time_zone: str | None = datetimes.dtype.time_zone  # type: ignore[attr-defined]
+        steps = datetimes.diff().drop_nulls().unique()
+        if (
+            datetimes.is_empty()
+            or len(steps) > 1
+            or (len(steps) == 1 and steps[0] <= dt.timedelta(0))
+        ):
+            times = pd.DatetimeIndex(datetimes.to_pandas())
+            cs = _compute_clearsky_irradiance(self.location, times)
+        else:
+            if time_zone is not None:
+                datetimes = datetimes.dt.convert_time_zone("UTC")
+                datetimes = datetimes.dt.replace_time_zone(None)
+            freq = steps[0] if len(steps) else dt.timedelta(hours=1)
+            cs = _clearsky_irradiance(
+                self.location, datetimes[0], datetimes[-1], freq, time_zone
+            )
         return weather_df.with_columns([cs["ghi"], cs["dni"], cs["dhi"]])
 
 
+@lru_cache(maxsize=4)
+def _read_tmy_data(path: Path, mtime_ns: int) -> pl.DataFrame:  # noqa: ARG001
+    """Read stored PVGIS TMY data, cached by path and modification time.
+
+    :param path: The path to the Parquet file.
+    :param mtime_ns: Modification time of the file, only used as part of the cache key.
+    :return: The TMY data with a datetime column of dtype Datetime("ms", "UTC").
+    """
+    _LOGGER.debug("Loading PVGIS data from %s", path)
+    # parquet keeps the column types, no parsing needed
+    tmy_data = pl.read_parquet(path)
+    return tmy_data.cast({"datetime": pl.Datetime(time_unit="ms", time_zone="UTC")})
+
+
+def _is_transient_pvgis_error(exc: requests.RequestException) -> bool:
+    """Check whether a failed PVGIS request may succeed when it is retried.
+
+    Connection errors, timeouts and server errors (5xx) are transient. PVGIS reports
+    invalid requests, e.g. a location at sea, as an HTTPError without a response.
+
+    :param exc: The exception raised by the PVGIS request.
+    :return: True if the request should be retried.
+    """
+    if isinstance(exc, requests.HTTPError):
+        return exc.response is not None and exc.response.status_code >= 500
+    return isinstance(exc, (requests.ConnectionError, requests.Timeout))
+
+
 @dataclass
 class Historical(PowerEstimate):
     """Class for PV power forecasts based on weather data."""
 
     fc_type: ForecastType = field(default=ForecastType.HISTORICAL)
+    # timeout of a single PVGIS API request
+    pvgis_timeout: dt.timedelta = field(
+        default=dt.timedelta(seconds=PVGIS_TIMEOUT), repr=False
+    )
     _pvgis_data_path: Path = field(init=False, repr=False, default=Path())
 
     def __post_init__(self) -> None:
         """Post init method."""
+        super().__post_init__()
         lat_i, lat_d = str(round(self.location.latitude, 4)).split(".")
         lon_i, lon_d = str(round(self.location.longitude, 4)).split(".")
         lat = f"{lat_i}_{lat_d.ljust(4, '0')}N"
         lon = f"{lon_i}_{lon_d.ljust(4, '0')}E"
         self._pvgis_data_path = Path(
-            f"pvcast/data/pvgis/pvgis_tmy_{lat}_{lon}_{PVGIS_TMY_START}_{PVGIS_TMY_END}.csv"
+            f"pvcast/data/pvgis/pvgis_tmy_{lat}_{lon}_{PVGIS_TMY_START}_{PVGIS_TMY_END}.parquet"
         )
 
     def _prepare_weather(self, weather_df: pl.DataFrame | None = None) -> pl.DataFrame:
-        # if the PVGIS data file does not exist, retrieve it from the API and store it
-        tmy_data: pl.LazyFrame
-        if not self._pvgis_data_path.exists():
-            self._store_pvgis_data_api()
-
-        # scan data from CSV file
-        tmy_data = pl.scan_csv(self._pvgis_data_path)
+        tmy_data = self._load_tmy_data()
 
         # if there are no specifically requested dates, return the entire TMY dataset
         if weather_df is None:
-            return tmy_data.collect()
+            return tmy_data
 
         # get start and end dates we want to obtain TMY data for
         lower = weather_df["datetime"].min().replace(year=HISTORICAL_YEAR_MAPPING)  # type: ignore[union-attr, call-arg]
         upper = weather_df["datetime"].max().replace(year=HISTORICAL_YEAR_MAPPING)  # type: ignore[union-attr, call-arg]
-        return (
-            tmy_data.filter(
-                (pl.col("datetime").str.to_datetime() >= lower)
-                & (pl.col("datetime").str.to_datetime() <= upper)
-            )
-            .collect()
+        return tmy_data.filter(pl.col("datetime").is_between(lower, upper))
+
+    def _load_tmy_data(self) -> pl.DataFrame:
+        """Load the PVGIS TMY data, retrieving it from the PVGIS API if not stored yet.
+
+        The parsed data is kept in memory, shared by all plants at the same location,
+        and only read again when the file changes.
+
+        :return: The TMY data with a datetime column of dtype Datetime("ms", "UTC").
+        """
+        # if the PVGIS data file does not exist, convert a CSV file stored by an older
+        # version or retrieve it from the API and store it. Plants at the same location
+        # may run concurrently, retrieve the data once.
+        if not self._pvgis_data_path.exists():
+            with _PVGIS_LOCKS_LOCK:
+                pvgis_lock = _PVGIS_LOCKS[self._pvgis_data_path]
+            with pvgis_lock:
+                if not self._pvgis_data_path.exists():
+                    legacy_path = self._pvgis_data_path.with_suffix(".csv")
+                    if legacy_path.exists():
+                        self._convert_pvgis_data_csv(legacy_path)
+                    else:
+                        self._store_pvgis_data_api()
+        return _read_tmy_data(
+            self._pvgis_data_path, self._pvgis_data_path.stat().st_mtime_ns
+        )
+
+    def _convert_pvgis_data_csv(self, csv_path: Path) -> None:
+        """Convert PVGIS data stored as CSV by an older version to Parquet.
+
+        :param csv_path: The path to the CSV file.
+        """
+        _LOGGER.info("Converting PVGIS data %s to Parquet.", csv_path)
+        tmy_df = (
+            pl.read_csv(csv_path)
+            .with_columns(pl.col("datetime").str.to_datetime())
             .cast({"datetime": pl.Datetime(time_unit="ms", time_zone="UTC")})
         )
+        self._write_pvgis_data(tmy_df)
+
+    def _write_pvgis_data(self, tmy_df: pl.DataFrame) -> None:
+        """Write the PVGIS data to its Parquet file.
+
+        Writes to a temporary file first so an interrupted write never leaves a
+        partial file.
+
+        :param tmy_df: The TMY data.
+        """
+        tmp_path = self._pvgis_data_path.with_name(f"{self._pvgis_data_path.name}.tmp")
+        tmy_df.write_parquet(tmp_path)
+        tmp_path.replace(self._pvgis_data_path)
 
     def _store_pvgis_data_api(self) -> None:
-        """Retrieve the PVGIS data using the PVGIS API and store it as a CSV file."""
+        """Retrieve the PVGIS data using the PVGIS API and store it as Parquet."""
         _LOGGER.debug("Saving PVGIS data from API at: %s", self._pvgis_data_path)
 
         # create parent directory
@@ -385,14 +618,28 @@ class Historical(PowerEstimate):
         # 4th decimal is accurate to 11.1m
         lat = round(self.location.latitude, 4)
         lon = round(self.location.longitude, 4)
-        tmy_data, __, __, __ = get_pvgis_tmy(
-            latitude=lat,
-            longitude=lon,
-            outputformat="json",
-            startyear=PVGIS_TMY_START,
-            endyear=PVGIS_TMY_END,
-            map_variables=True,
-        )
+        for attempt in range(1, PVGIS_ATTEMPTS + 1):
+            try:
+                tmy_data, __, __, __ = get_pvgis_tmy(
+                    latitude=lat,
+                    longitude=lon,
+                    outputformat="json",
+                    startyear=PVGIS_TMY_START,
+                    endyear=PVGIS_TMY_END,
+                    map_variables=True,
+                    timeout=int(self.pvgis_timeout.total_seconds()),
+                )
+                break
+            except requests.RequestException as exc:
+                if attempt == PVGIS_ATTEMPTS or not _is_transient_pvgis_error(exc):
+                    raise
+                _LOGGER.warning(
+                    "PVGIS request failed (attempt %s of %s), retrying.",
+                    attempt,
+                    PVGIS_ATTEMPTS,
+                    exc_info=True,
+                )
+                time.sleep(2**attempt)
 
         # convert the data to a polars DataFrame
         tmy_df: pl.DataFrame = pl.from_pandas(tmy_data)  # fc_type: ignore[assignment]
@@ -405,7 +652,7 @@ class Historical(PowerEstimate):
         )
 
         # calculate precipitable water from temperature and humidity and add it to tmy_df
-        tmy_df = self._add_precipitable_water(tmy_df)
+        tmy_df = self.add_precipitable_water(tmy_df)
 
         # add datetime column
         tmy_df = tmy_df.with_columns(
@@ -436,5 +683,4 @@ class Historical(PowerEstimate):
         )
         _LOGGER.debug("PVGIS data retrieved: %s", tmy_df)
 
-        # save the PVGIS data as a CSV file to the path
-        tmy_df.write_csv(self._pvgis_data_path)
+        self._write_pvgis_data(tmy_df)
@@ -2,27 +2,100 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+from collections.abc import Mapping
 from dataclasses import InitVar, dataclass, field
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
+import pandas as pd
 import polars as pl
 from pvlib.location import Location
 from pvlib.modelchain import ModelChain
 from pvlib.pvsystem import Array, FixedMount, PVSystem
 from pvlib.temperature import TEMPERATURE_MODEL_PARAMETERS
 
-from .const import BASE_CEC_DATA_PATH
+from pvcast.const import SOLAR_POSITION_METHOD
+
+from .const import BASE_CEC_DATA_PATH, CEC_CACHE_PATH
 from .forecasting import Clearsky, Historical, Live
 
 if TYPE_CHECKING:
     from pathlib import Path
-    from types import MappingProxyType
 
 _LOGGER = logging.getLogger(__name__)
 
+# default cell temperature model parameters, read-only as they are shared by all plants
+DEFAULT_TEMP_PARAM: Mapping[str, float] = MappingProxyType(
+    TEMPERATURE_MODEL_PARAMETERS["pvsyst"]["freestanding"]
+)
 
-@dataclass
+
+def _config_fingerprint(
+    config: list[MappingProxyType[str, Any]], lat: float, lon: float, alt: float
+) -> str:
+    """Hash a PV plant configuration together with its location.
+
+    :param config: A list of PV plant param dicts.
+    :param lat: PV system location latitude.
+    :param lon: PV system location longitude.
+    :param alt: PV system altitude.
+    :return: Hex digest that changes whenever any of the inputs change.
+    """
+    serialized = json.dumps(
+        {"plant": config, "location": [lat, lon, alt]},
+        default=lambda obj: dict(obj) if isinstance(obj, Mapping) else str(obj),
+        sort_keys=True,
+    )
+    return hashlib.blake2b(serialized.encode(), digest_size=16).hexdigest()
+
+
+def _cec_cache_path(path: Path, cache_dir: Path) -> Path:
+    """Get the path of the cached Parquet copy of a CEC database.
+
+    :param path: The path to the CEC database CSV file.
+    :param cache_dir: The directory holding the cached Parquet copies.
+    :return: Path of the Parquet copy, unique for each CSV file.
+    """
+    digest = hashlib.blake2b(str(path.resolve()).encode(), digest_size=8).hexdigest()
+    return cache_dir / f"{path.stem}_{digest}.parquet"
+
+
+def _scan_cec_database(path: Path, cache_dir: Path | None = None) -> pl.LazyFrame:
+    """Scan a CEC database, preferring a cached Parquet copy of the CSV file if present.
+
+    The CSV file is converted to Parquet the first time it is loaded, or when it is
+    newer than its Parquet copy, so that later loads do not need to parse it.
+
+    :param path: The path to the CEC database CSV file.
+    :param cache_dir: The directory holding the cached Parquet copies, defaults to
+        CEC_CACHE_PATH.
+    :return: The CEC database as a polars LazyFrame.
+    """
+    if cache_dir is None:
+        cache_dir = CEC_CACHE_PATH
+    parquet_path = _cec_cache_path(path, cache_dir)
+    if parquet_path.exists() and (
+        not path.exists() or parquet_path.stat().st_mtime >= path.stat().st_mtime
+    ):
+        _LOGGER.debug("Loading CEC database from %s", parquet_path)
+        return pl.scan_parquet(parquet_path)
+
+    _LOGGER.debug("Loading CEC database from %s", path)
+    cec_df = pl.read_csv(path)
+    tmp_path = parquet_path.with_suffix(".parquet.tmp")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cec_df.write_parquet(tmp_path, compression="zstd")
+        tmp_path.replace(parquet_path)
+    except OSError:
+        _LOGGER.warning("Could not cache a Parquet copy of %s", path, exc_info=True)
+    return cec_df.lazy()
+
+
+@dataclass(slots=True)
 class PVPlantModel:
     """Implements the entire PV model chain based on the parameters set in config.yaml.
 
@@ -49,12 +122,11 @@ class PVPlantModel:
     location: Location = field(repr=False)
     inv_param: InitVar[pl.LazyFrame]
     mod_param: InitVar[pl.LazyFrame]
-    temp_param: dict[str, dict[str, dict[str, Any]]] = field(
-        default_factory=lambda: TEMPERATURE_MODEL_PARAMETERS["pvsyst"]["freestanding"],
-        repr=False,
+    temp_param: Mapping[str, float] = field(
+        default_factory=lambda: DEFAULT_TEMP_PARAM, repr=False
     )
     name: str = field(init=False)
-    _pv_models: list[ModelChain] = field(init=False, repr=False)
+    _pv_systems: list[tuple[PVSystem, int]] = field(init=False, repr=False)
     _clearsky: Clearsky = field(init=False, repr=False)
     _historical: Historical = field(init=False, repr=False)
     _live: Live = field(init=False, repr=False)
@@ -73,12 +145,17 @@ class PVPlantModel:
         :param inv_param: The inverter parameters.
         :param mod_param: The module parameters.
         """
-        pv_systems = self._create_pv_systems(config, inv_param, mod_param)
-        self._pv_models = [
-            ModelChain(system, self.location, name=config["name"], aoi_model="physical")
-            for system in pv_systems
-        ]
         self.name = config["name"]
+        pv_systems = self._create_pv_systems(config, inv_param, mod_param)
+
+        # the microinverters of one array share their PVSystem, store each PVSystem once
+        # with the number of inverters it models. The forecast objects build the model
+        # chains from them.
+        system_counts: dict[int, tuple[PVSystem, int]] = {}
+        for system in pv_systems:
+            _, count = system_counts.get(id(system), (system, 0))
+            system_counts[id(system)] = (system, count + 1)
+        self._pv_systems = list(system_counts.values())
 
         # create the forecast objects
         self._clearsky = Clearsky(location=self.location, pv_plant=self)
@@ -101,9 +178,26 @@ class PVPlantModel:
         return self._live
 
     @property
-    def models(self) -> list[ModelChain]:
-        """The PV system model chains."""
-        return self._pv_models
+    def pv_systems(self) -> list[tuple[PVSystem, int]]:
+        """The distinct PV systems, each with the number of inverters it models.
+
+        The microinverters of one array share the same PVSystem instance.
+        """
+        return self._pv_systems
+
+    def create_model_chain(self, system: PVSystem, **model_attrs: str) -> ModelChain:
+        """Create a ModelChain for one of the PV systems of this plant.
+
+        :param system: The PV system to model.
+        :param model_attrs: ModelChain model names overriding the plant defaults.
+        :return: The model chain.
+        """
+        model_attrs = {
+            "aoi_model": "physical",
+            "solar_position_method": SOLAR_POSITION_METHOD,
+            **model_attrs,
+        }
+        return ModelChain(system, self.location, name=self.name, **model_attrs)
 
     def _create_pv_systems(
         self,
@@ -167,8 +261,9 @@ class PVPlantModel:
         """
         _LOGGER.debug("Building microinverter system model for system %s", name)
         pv_systems = []
+        inverter_param = next(iter(inv_param.values()))
 
-        # create a PVSystem for each microinverter
+        # create the PV systems, one entry per microinverter
         for _, array in enumerate(arrays):
             n_modules = int(array["strings"]) * int(array["modules_per_string"])
             mount = FixedMount(
@@ -176,27 +271,22 @@ class PVPlantModel:
             )
             module_param = mod_param[array["module"]]  # type: ignore[index]
 
-            # each module has it's own inverter therefore must have its own PVSystem
-            for module_id in range(n_modules):
-                module_name = f"{array['name']}_array_{module_id}"
-
-                # define PV array
-                arr = Array(
-                    mount=mount,
-                    module_parameters=module_param,
-                    temperature_model_parameters=self.temp_param,
-                    strings=1,
-                    modules_per_string=1,
-                    name=module_name,
-                )
-
-                # define PVSystem
-                pv_system = PVSystem(
-                    arrays=[arr],
-                    inverter_parameters=next(iter(inv_param.values())),
-                    name=name,
-                )
-                pv_systems.append(pv_system)
+            # each module has it's own inverter therefore must have its own ModelChain,
+            # the modules of an array are identical so they share one PVSystem
+            arr = Array(
+                mount=mount,
+                module_parameters=module_param,
+                temperature_model_parameters=self.temp_param,
+                strings=1,
+                modules_per_string=1,
+                name=f"{array['name']}_array",
+            )
+            pv_system = PVSystem(
+                arrays=[arr],
+                inverter_parameters=inverter_param,
+                name=name,
+            )
+            pv_systems.extend([pv_system] * n_modules)
 
         return pv_systems
 
@@ -277,6 +367,7 @@ class PVSystemManager:
         default=BASE_CEC_DATA_PATH / "cec_modules.csv", repr=False
     )
     _pv_plants: dict[str, PVPlantModel] = field(init=False, repr=False)
+    _config_fingerprint: str = field(init=False, repr=False)
 
     def __post_init__(  # pylint: disable=too-many-arguments
         self, lat: float, lon: float, alt: float, inv_path: Path, mod_path: Path
@@ -285,10 +376,19 @@ class PVSystemManager:
         self._loc = Location(
             lat, lon, tz="UTC", altitude=alt, name=f"PV plant at {lat}, {lon}"
         )
+        self._config_fingerprint = _config_fingerprint(self.config, lat, lon, alt)
+
+        # compile the numba solar position algorithm up front instead of in the first,
+        # possibly concurrent, model chain run
+        if SOLAR_POSITION_METHOD == "nrel_numba":
+            self._loc.get_solarposition(
+                pd.DatetimeIndex(["2020-01-01"], tz="UTC"),
+                method=SOLAR_POSITION_METHOD,
+            )
 
         # load the CEC databases as polars LazyFrames which can
-        inv_param: pl.LazyFrame = pl.scan_csv(inv_path)
-        mod_param: pl.LazyFrame = pl.scan_csv(mod_path)
+        inv_param: pl.LazyFrame = _scan_cec_database(inv_path)
+        mod_param: pl.LazyFrame = _scan_cec_database(mod_path)
         self._pv_plants = self._create_pv_plants(inv_param, mod_param)
         _LOGGER.info(
             "Created PV system manager with %s PV plants.", len(self._pv_plants)
@@ -299,6 +399,11 @@ class PVSystemManager:
         """Location of the PV system encoded as a PVLib Location object."""
         return self._loc
 
+    @property
+    def config_fingerprint(self) -> str:
+        """Hash of the plant configuration and location the manager was built from."""
+        return self._config_fingerprint
+
     @property
     def pv_plants(self) -> dict[str, PVPlantModel]:
         """The PV plants."""
@@ -329,6 +434,19 @@ class PVSystemManager:
         :return: List of PV system model chains. One ModelChain instance for each inverter in the config.
         """
         _LOGGER.debug("Creating PV plant model.")
+
+        # scan each database once for the devices of all plants instead of once per
+        # plant, the plants then only filter these small in-memory frames. Duplicate
+        # entries are dropped here once so every plant sees one row per device.
+        inverters = [plant_config["inverter"] for plant_config in self.config]
+        modules = [
+            array["module"]
+            for plant_config in self.config
+            for array in plant_config["arrays"]
+        ]
+        inv_param = self._select_devices(inv_param, inverters)
+        mod_param = self._select_devices(mod_param, modules)
+
         pv_plants = {}
         for plant_config in self.config:
             pv_plant = PVPlantModel(
@@ -341,6 +459,21 @@ class PVSystemManager:
 
         return pv_plants
 
+    @staticmethod
+    def _select_devices(params: pl.LazyFrame, devices: list[str]) -> pl.LazyFrame:
+        """Select the parameters of the given devices from a CEC database.
+
+        :param params: The CEC database.
+        :param devices: The names of the devices to select.
+        :return: In-memory LazyFrame with one row per device, the first entry wins.
+        """
+        return (
+            params.filter(pl.col("index").is_in(devices))
+            .unique(subset=["index"], keep="first", maintain_order=True)
+            .collect()
+            .lazy()
+        )
+
     @property
     def plant_names(self) -> list[str]:
         """Return the names of the PV plants."""
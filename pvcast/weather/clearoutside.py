@@ -10,6 +10,7 @@ from urllib.parse import urljoin
 import polars as pl
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 
 from pvcast.weather.weather import WeatherAPI
 
@@ -23,6 +24,9 @@ class WeatherAPIClearOutside(WeatherAPI):
     sourcetype: str = field(default="clearoutside")
     url: str = field(init=False)
     _url_base: InitVar[str] = field(default="https://clearoutside.com/forecast/")
+    _session: requests.Session = field(
+        default_factory=requests.Session, init=False, repr=False
+    )
 
     def __post_init__(self, _url_base: str) -> None:
         """Post init function."""
@@ -30,9 +34,16 @@ class WeatherAPIClearOutside(WeatherAPI):
         lon = str(round(self.location.longitude, 2))
         self.url = urljoin(_url_base, f"{lat}/{lon}")
 
+        # reuse the connection (and TLS session) to clear outside between updates
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
     def retrieve_new_data(self) -> pl.DataFrame:
         """Retrieve weather data by scraping it from the clear outside website."""
-        response = requests.get(self.url, timeout=int(self.timeout.total_seconds()))
+        response = self._session.get(
+            self.url, timeout=int(self.timeout.total_seconds())
+        )
 
         # response (source) data bucket
         weather_df = pl.DataFrame()
@@ -15,7 +15,7 @@ import polars as pl
 import voluptuous as vol
 from pvlib.irradiance import campbell_norman, disc, get_extra_radiation
 
-from pvcast.const import DT_FORMAT
+from pvcast.const import DT_FORMAT, SOLAR_POSITION_METHOD
 from pvcast.util.timestamps import timedelta_to_pl_duration
 
 if TYPE_CHECKING:
@@ -106,6 +106,11 @@ class WeatherAPI(ABC):
     # processed weather data as list of dicts
     _weather_data: dict[str, Any] = field(default_factory=dict, repr=False, init=False)
 
+    # processed weather data as a typed polars DataFrame
+    _weather_df: pl.DataFrame = field(
+        default_factory=pl.DataFrame, repr=False, init=False
+    )
+
     @property
     def dt_new_data(self) -> dt.timedelta:
         """Get the time delta since the last update."""
@@ -175,10 +180,11 @@ class WeatherAPI(ABC):
         if not processed_data["datetime"].is_sorted():
             msg = "Processed data is not sorted."
             raise WeatherAPIError(msg)
-        if processed_data["datetime"].dtype != pl.Datetime:
-            processed_data = processed_data.with_columns(
-                pl.col("datetime").str.to_datetime()
-            )
+
+        # normalize datetimes once at fetch time so consumers get a typed UTC column
+        processed_data = processed_data.with_columns(
+            self._to_utc_ms(processed_data["datetime"])
+        )
 
         # check for gaps in the datetime index
         if not all(
@@ -235,7 +241,8 @@ class WeatherAPI(ABC):
                 self.cloud_cover_to_irradiance(processed_data)
             )
 
-        # convert datetime column to str
+        # keep the typed frame, then convert the datetime column to str for the dict
+        weather_df = processed_data
         processed_data = processed_data.with_columns(
             processed_data["datetime"].dt.strftime(DT_FORMAT)
         )
@@ -256,8 +263,39 @@ class WeatherAPI(ABC):
 
         # cache data
         self._weather_data = validated_data
+        self._weather_df = weather_df
         return validated_data
 
+    @staticmethod
+    def _to_utc_ms(datetimes: pl.Series) -> pl.Series:
+        """Convert a datetime (or datetime string) series to dtype Datetime("ms", "UTC").
+
+        Naive datetimes are assumed to be in UTC.
+
+        :param datetimes: The datetimes to convert.
+        :return: The converted datetimes.
+        """
+        if datetimes.dtype != pl.Datetime:
+            datetimes = datetimes.str.to_datetime(time_unit="ms")
+        if datetimes.dtype.time_zone is None:  # type: ignore[attr-defined]
+            datetimes = datetimes.dt.replace_time_zone("UTC")
+        return datetimes.dt.convert_time_zone("UTC").dt.cast_time_unit("ms")
+
+    def get_weather_df(
+        self, *, live: bool = False, calc_irrads: bool = False
+    ) -> pl.DataFrame:
+        """Get weather data as a typed polars DataFrame. Datetimes are always in UTC.
+
+        This returns the same (cached) data as get_weather, but in columnar form, so
+        callers don't have to rebuild a DataFrame from the list of dicts.
+
+        :param live: Before returning weather data force a weather API update.
+        :param calc_irrads: Whether to calculate irradiance from cloud cover and add it to the weather data.
+        :return: The weather data as a pl.DataFrame.
+        """
+        self.get_weather(live=live, calc_irrads=calc_irrads)
+        return self._weather_df
+
     def cloud_cover_to_irradiance(
         self, cloud_cover: pl.DataFrame, how: str = "clearsky_scaling", **kwargs: Any
     ) -> pl.DataFrame:
@@ -305,7 +343,7 @@ class WeatherAPI(ABC):
         :return: Irradiance, columns include ghi, dni, dhi.
         """
         # get clear sky data for provided datetimes
-        solpos = self.location.get_solarposition(times)
+        solpos = self.location.get_solarposition(times, method=SOLAR_POSITION_METHOD)
         clear_sky = self.location.get_clearsky(times, "ineichen", solpos)
         cover = pl.Series.to_pandas(cloud_cover["cloud_cover"])
 
@@ -332,7 +370,9 @@ class WeatherAPI(ABC):
         :return: Irradiance as a polars pl.DataFrame with columns ghi, dni, dhi.
         """
         # get clear sky data for provided datetimes
-        zen = self.location.get_solarposition(times)["apparent_zenith"].to_numpy()
+        zen = self.location.get_solarposition(times, method=SOLAR_POSITION_METHOD)[
+            "apparent_zenith"
+        ].to_numpy()
         dni_extra = get_extra_radiation(times).to_numpy()
         transmittance = self._cloud_cover_to_transmittance_linear(
             cloud_cover["cloud_cover"].to_numpy(), **kwargs
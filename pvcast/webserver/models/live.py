@@ -21,7 +21,7 @@ class LiveModel(BaseDataModel, WeatherSource):
 
 
 # create enum of weather sources configured in config.yaml
-weather_sources = {obj.name: obj.name for obj in get_weather_sources()}
+weather_sources = {name: name for name in get_weather_sources()}
 TypeEnum = Enum("TypeEnum", weather_sources)  # type: ignore[misc]
 
 
@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 import datetime as dt
+from types import MappingProxyType  # noqa: TCH003
 
-import polars as pl
 from fastapi import APIRouter, Depends, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from typing_extensions import Annotated
 
 from pvcast.model.model import PVSystemManager  # noqa: TCH001
@@ -22,14 +24,19 @@ from pvcast.webserver.routers.dependencies import (
 
 from .helpers import get_forecast_result_dict
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# clearsky irradiance is computed at an hourly resolution and upsampled afterwards
+SOURCE_INTERVAL = dt.timedelta(hours=1)
 
 
 @router.get("/{plant_name}/{interval}")
-def get(  # pylint: disable=too-many-arguments
+async def get(  # pylint: disable=too-many-arguments
     plant_name: PVPlantNames,
     pv_system_mngr: Annotated[PVSystemManager, Depends(get_pv_system_mngr)],
-    weather_apis: Annotated[list[WeatherAPI], Depends(get_weather_sources)],
+    weather_apis: Annotated[
+        MappingProxyType[str, WeatherAPI], Depends(get_weather_sources)
+    ],
     start: Annotated[
         dt.datetime, Query(description="Start datetime in ISO format.")
     ] = START_DT_DEFAULT,
@@ -50,15 +57,20 @@ def get(  # pylint: disable=too-many-arguments
     :return: Estimated PV power output in Watts at the given interval <interval> for the given PV system <name>
     """
     # for clearsky we don't care which weather API is used, so just use the first one
-    weather_api = weather_apis[0]
+    weather_api = next(iter(weather_apis.values()))
 
     # build the datetime index
-    datetimes = weather_api.get_source_dates(start, end, dt.timedelta(hours=1))
-    # convert datetimes to dataframe
-    weather_df = pl.DataFrame(datetimes.alias("datetime"))
+    datetimes = weather_api.get_source_dates(start, end, SOURCE_INTERVAL)
+    # convert datetimes to a single column dataframe without schema inference
+    weather_df = datetimes.alias("datetime").to_frame()
 
     # get the PV power output
-    response_dict = get_forecast_result_dict(
-        str(plant_name.name), pv_system_mngr, "clearsky", interval, weather_df
+    response_dict = await run_in_threadpool(
+        get_forecast_result_dict,
+        str(plant_name.name),
+        pv_system_mngr,
+        "clearsky",
+        interval,
+        weather_df,
     )
     return ClearskyModel(**response_dict)
@@ -6,6 +6,7 @@ import logging
 import os
 from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 from pvlib.location import Location
@@ -33,49 +34,48 @@ def get_config_reader() -> ConfigReader:
 @lru_cache
 def get_pv_system_mngr() -> PVSystemManager:
     """Get the PV system manager instance."""
-    config_reader = get_config_reader()
+    config = get_config_reader().config
+    location = config["general"]["location"]  # type: ignore[index]
     return PVSystemManager(
-        config=config_reader.config["plant"],  # type: ignore[arg-type]
-        lat=config_reader.config["general"]["location"]["latitude"],  # type: ignore[index]
-        lon=config_reader.config["general"]["location"]["longitude"],  # type: ignore[index]
-        alt=config_reader.config["general"]["location"]["altitude"],  # type: ignore[index]
+        config=config["plant"],  # type: ignore[arg-type]
+        lat=location["latitude"],
+        lon=location["longitude"],
+        alt=location["altitude"],
     )
 
 
 @lru_cache
-def get_weather_sources() -> tuple[WeatherAPI, ...]:
-    """Get the weather API instances from config_reader."""
-    config_reader = get_config_reader()
+def get_weather_sources() -> MappingProxyType[str, WeatherAPI]:
+    """Get the weather API instances from config_reader, keyed by their unique name."""
+    general_config = get_config_reader().config["general"]
 
     # all sources of weather data must be listed in the config file
-    weather_data_sources = config_reader.config["general"]["weather"]["sources"]  # type: ignore[index]
-
-    max_forecast_days = dt.timedelta(
-        days=int(config_reader.config["general"]["weather"]["max_forecast_days"])  # type: ignore[index]
-    )
+    weather_config = general_config["weather"]  # type: ignore[index]
+    weather_data_sources = weather_config["sources"]
+    max_forecast_days = dt.timedelta(days=int(weather_config["max_forecast_days"]))
 
     # get the location
-    latitude = config_reader.config["general"]["location"]["latitude"]  # type: ignore[index]
-    longitude = config_reader.config["general"]["location"]["longitude"]  # type: ignore[index]
-    altitude = config_reader.config["general"]["location"]["altitude"]  # type: ignore[index]
+    location_config = general_config["location"]  # type: ignore[index]
     location = Location(
-        latitude=latitude, longitude=longitude, tz="UTC", altitude=altitude
+        latitude=location_config["latitude"],
+        longitude=location_config["longitude"],
+        tz="UTC",
+        altitude=location_config["altitude"],
     )
 
     # get all weather APIs from the factory
-    weather_apis = []
+    weather_apis: dict[str, WeatherAPI] = {}
     for source in weather_data_sources:
         # metadata is everything except name and type
         metadata = source.copy()
         source_type = metadata.pop("type")
 
-        # add the weather API to the list
-        weather_apis.append(
-            API_FACTORY.get_weather_api(
-                source_type,
-                max_forecast_days=max_forecast_days,
-                location=location,
-                **metadata,
-            )
+        # add the weather API to the lookup table
+        weather_api = API_FACTORY.get_weather_api(
+            source_type,
+            max_forecast_days=max_forecast_days,
+            location=location,
+            **metadata,
         )
-    return tuple(weather_apis)
+        weather_apis[weather_api.name] = weather_api
+    return MappingProxyType(weather_apis)
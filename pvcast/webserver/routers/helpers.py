@@ -1,27 +1,59 @@
 """Helper functions for the webserver."""
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 import polars as pl
 
 from pvcast.const import DT_FORMAT
+from pvcast.model.forecasting import ForecastType, PowerEstimate
 
 if TYPE_CHECKING:
-    from pvcast.model.forecasting import ForecastResult, PowerEstimate
+    from pvcast.model.forecasting import ForecastResult
     from pvcast.model.model import PVSystemManager
     from pvcast.webserver.models.base import Interval
 
 _LOGGER = logging.getLogger(__name__)
 
+# forecast results are cached by configuration, plant, forecast type, interval and
+# weather data. The cache is bounded by its number of results and by the total number
+# of period rows they hold, long historical ranges at a short interval are large.
+RESULT_CACHE_SIZE = 128
+RESULT_CACHE_MAX_ROWS = 1_000_000
+_result_cache: OrderedDict[tuple[Any, ...], dict[str, Any]] = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+# shared by all requests so that running the PV plants of an 'all' request does not
+# start new threads. Kept separate from the model chain executor the plants submit to,
+# so plants waiting on their model chains never occupy the threads those need.
+_PV_PLANT_EXECUTOR = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="pvcast_pv_plant"
+)
+
+
+def _weather_digest(weather_df: pl.DataFrame) -> str:
+    """Compute a digest of the weather data content.
+
+    :param weather_df: Weather dataframe
+    :return: Hex digest of the row hashes of weather_df
+    """
+    row_hashes = weather_df.hash_rows().to_numpy().tobytes()
+    return hashlib.blake2b(row_hashes, digest_size=16).hexdigest()
+
 
 def get_forecast_result_dict(
     plant_name: str,
     pv_system_mngr: PVSystemManager,
     fc_type: str,
     interval: Interval,
-    weather_df: pl.DataFrame,
+    weather_df: pl.DataFrame | pl.Series,
 ) -> dict[str, Any]:
     """Use the weather data to compute the estimated PV output power in Watts.
 
@@ -31,7 +63,7 @@ def get_forecast_result_dict(
     :param pv_system_mngr: PV system manager
     :param fc_type: Forecasting algorithm type
     :param interval: Interval of the returned data
-    :param weather_df: Weather dataframe
+    :param weather_df: Weather dataframe, or a series named "datetime" if only the datetimes are needed
     :return: Nested dict
     """
     if pv_system_mngr.pv_plant_count == 0:
@@ -42,27 +74,114 @@ def get_forecast_result_dict(
         msg = "Weather dataframe is empty. Check the weather API."
         raise ValueError(msg)
 
+    # the forecasting algorithms expect a DataFrame, wrapping the series is cheap
+    if isinstance(weather_df, pl.Series):
+        weather_df = weather_df.to_frame()
+
+    # return a cached result if the same request was computed before with the same
+    # PV plant configuration. Callers may add keys to the returned dict, so they get a
+    # shallow copy of the cached result, the period rows must be treated as read-only.
+    key = (
+        pv_system_mngr.config_fingerprint,
+        plant_name,
+        fc_type,
+        interval.value,
+        tuple(weather_df.columns),
+        _weather_digest(weather_df),
+    )
+    with _result_cache_lock:
+        cached_result = _result_cache.get(key)
+        if cached_result is not None:
+            _LOGGER.debug("Using cached forecast result for plant: %s", plant_name)
+            _result_cache.move_to_end(key)
+            return {**cached_result}
+
+    result = _compute_forecast_result_dict(
+        plant_name, pv_system_mngr, fc_type, interval, weather_df
+    )
+    _store_result(key, result)
+    return {**result}
+
+
+def _store_result(key: tuple[Any, ...], result: dict[str, Any]) -> None:
+    """Store a forecast result in the result cache, evicting the oldest results.
+
+    :param key: Cache key of the result
+    :param result: Forecast result dict
+    """
+    if len(result["period"]) > RESULT_CACHE_MAX_ROWS:
+        return
+    with _result_cache_lock:
+        _result_cache[key] = result
+        _result_cache.move_to_end(key)
+        n_rows = sum(len(cached["period"]) for cached in _result_cache.values())
+        while (
+            len(_result_cache) > RESULT_CACHE_SIZE or n_rows > RESULT_CACHE_MAX_ROWS
+        ):
+            _, evicted = _result_cache.popitem(last=False)
+            n_rows -= len(evicted["period"])
+
+
+def _run_pv_plant(
+    pv_plant: str,
+    pv_system_mngr: PVSystemManager,
+    fc_type: str,
+    weather_df: pl.DataFrame,
+) -> ForecastResult:
+    """Run the forecasting algorithm of type fc_type for a single PV plant.
+
+    :param pv_plant: Name of the PV plant
+    :param pv_system_mngr: PV system manager holding the PV plant
+    :param fc_type: Forecast type
+    :param weather_df: Weather data or datetimes to forecast for
+    :return: The forecast result of the PV plant
+    """
+    _LOGGER.info("Calculating PV output for plant: %s", pv_plant)
+
+    # compute the PV output for the given PV system and datetimes
+    pvplant = pv_system_mngr.get_pv_plant(pv_plant)
+
+    # run forecasting algorithm
+    try:
+        pv_plant_type: PowerEstimate = getattr(pvplant, fc_type)
+    except AttributeError as exc:
+        msg = f"No forecasting algorithm found with name {fc_type}"
+        _LOGGER.exception(msg)
+        raise AttributeError(msg) from exc
+    return pv_plant_type.run(weather_df=weather_df)
+
+
+def _compute_forecast_result_dict(
+    plant_name: str,
+    pv_system_mngr: PVSystemManager,
+    fc_type: str,
+    interval: Interval,
+    weather_df: pl.DataFrame,
+) -> dict[str, Any]:
+    """Compute the forecast result dict, see get_forecast_result_dict."""
     # loop over all PV plants and find the one with the given name
     all_arg = plant_name.lower() == "all"
     pv_plant_names = list(pv_system_mngr.pv_plants.keys()) if all_arg else [plant_name]
 
-    # loop over all PV plants and compute the estimated power output
-    ac_w_period = pl.DataFrame()
-    for pv_plant in pv_plant_names:
-        _LOGGER.info("Calculating PV output for plant: %s", pv_plant)
-
-        # compute the PV output for the given PV system and datetimes
-        pvplant = pv_system_mngr.get_pv_plant(pv_plant)
-
-        # run forecasting algorithm
-        try:
-            pv_plant_type: PowerEstimate = getattr(pvplant, fc_type)
-        except AttributeError as exc:
-            msg = f"No forecasting algorithm found with name {fc_type}"
-            _LOGGER.exception(msg)
-            raise AttributeError(msg) from exc
-        output: ForecastResult = pv_plant_type.run(weather_df=weather_df)
+    # precipitable water only depends on the weather data, add it once for all plants
+    if fc_type == ForecastType.LIVE and len(pv_plant_names) > 1:
+        weather_df = PowerEstimate.add_precipitable_water(weather_df)
+
+    # compute the estimated power output of all PV plants, the plants are independent
+    # so with more than one they are run concurrently
+    run_pv_plant = partial(
+        _run_pv_plant,
+        pv_system_mngr=pv_system_mngr,
+        fc_type=fc_type,
+        weather_df=weather_df,
+    )
+    if len(pv_plant_names) > 1:
+        outputs = list(_PV_PLANT_EXECUTOR.map(run_pv_plant, pv_plant_names))
+    else:
+        outputs = [run_pv_plant(pv_plant) for pv_plant in pv_plant_names]
 
+    ac_w_period = pl.DataFrame()
+    for pv_plant, output in zip(pv_plant_names, outputs, strict=True):
         # upsample the output to the requested interval
         ac_w_period = ac_w_period.with_columns(
             output.upsample(interval).ac_power.rename({"ac_power": f"watt_{pv_plant}"})  # type: ignore[union-attr]
@@ -2,13 +2,16 @@
 from __future__ import annotations
 
 import datetime as dt
+import hashlib
 
+import numpy as np
 import polars as pl
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from typing_extensions import Annotated
 
 from pvcast.model.model import PVSystemManager  # noqa: TCH001
-from pvcast.weather.weather import WeatherAPI  # noqa: TCH001
 from pvcast.webserver.const import END_DT_DEFAULT, START_DT_DEFAULT
 from pvcast.webserver.models.base import (
     Interval,
@@ -17,19 +20,68 @@ from pvcast.webserver.models.base import (
 from pvcast.webserver.models.historical import HistoricalModel
 from pvcast.webserver.routers.dependencies import (
     get_pv_system_mngr,  # noqa: TCH001
-    get_weather_sources,  # noqa: TCH001
 )
 
 from .helpers import get_forecast_result_dict
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
+# historical responses only depend on the request parameters and the PV plant
+# configuration, let clients cache them
+HISTORICAL_MAX_AGE = 3600
 
-@router.get("/{plant_name}/{interval}")
-def get(  # pylint: disable=too-many-arguments
+
+def _hourly_utc_range(start: dt.datetime, end: dt.datetime) -> pl.Series:
+    """Build an hourly UTC datetime series from start to end (inclusive).
+
+    Equivalent to WeatherAPI.get_source_dates with a fixed one hour interval, but
+    generated with numpy which is considerably faster for short ranges.
+
+    :param start: Start datetime, naive datetimes are interpreted as UTC.
+    :param end: End datetime, naive datetimes are interpreted as UTC.
+    :return: Series named "datetime" with dtype Datetime("us", "UTC").
+    """
+    start_utc, end_utc = (
+        ts.astimezone(dt.timezone.utc).replace(tzinfo=None) if ts.tzinfo else ts
+        for ts in (start, end)
+    )
+    datetimes = np.arange(
+        np.datetime64(start_utc, "us"),
+        np.datetime64(end_utc, "us") + np.timedelta64(1, "us"),
+        np.timedelta64(1, "h"),
+    )
+    return pl.Series("datetime", datetimes).dt.replace_time_zone("UTC")
+
+
+def _historical_etag(
+    plant_name: str,
+    interval: Interval,
+    start: dt.datetime,
+    end: dt.datetime,
+    config_fingerprint: str,
+) -> str:
+    """Build a strong ETag for a historical response.
+
+    :param plant_name: Name of the PV system
+    :param interval: Interval of the returned data
+    :param start: Start datetime of the request
+    :param end: End datetime of the request
+    :param config_fingerprint: Fingerprint of the PV plant configuration
+    :return: Quoted ETag value.
+    """
+    key = (
+        f"{config_fingerprint}|{plant_name}|{interval.value}|"
+        f"{start.isoformat()}|{end.isoformat()}"
+    )
+    return f'"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}"'
+
+
+@router.get("/{plant_name}/{interval}", response_model=HistoricalModel)
+async def get(  # pylint: disable=too-many-arguments
+    request: Request,
+    response: Response,
     plant_name: PVPlantNames,
     pv_system_mngr: Annotated[PVSystemManager, Depends(get_pv_system_mngr)],
-    weather_apis: Annotated[list[WeatherAPI], Depends(get_weather_sources)],
     start: Annotated[
         dt.datetime,
         Query(
@@ -43,7 +95,7 @@ def get(  # pylint: disable=too-many-arguments
         ),
     ] = END_DT_DEFAULT,
     interval: Interval = Interval.H1,
-) -> HistoricalModel:
+) -> HistoricalModel | Response:
     """Get the estimated PV output power in Watts.
 
     Forecast is provided at interval <interval> for the given PV system <name>.
@@ -55,17 +107,30 @@ def get(  # pylint: disable=too-many-arguments
     :param interval: Interval of the returned data
     :return: Estimated PV power output in Watts at the given interval <interval> for the given PV system <name>
     """
-    # for historical we don't care which weather API is used, so just use the first one
-    weather_api = weather_apis[0]
-
-    # build the datetime index
-    datetimes = weather_api.get_source_dates(start, end, dt.timedelta(hours=1))
+    # let the client reuse its cached copy if neither the request parameters nor the
+    # PV plant configuration changed
+    etag = _historical_etag(
+        plant_name.name, interval, start, end, pv_system_mngr.config_fingerprint
+    )
+    cache_headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={HISTORICAL_MAX_AGE}",
+    }
+    if_none_match = request.headers.get("If-None-Match", "")
+    if cache_headers["ETag"] in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=cache_headers)
+    response.headers.update(cache_headers)
 
-    # convert datetimes to dataframe
-    weather_df = pl.DataFrame(datetimes.alias("datetime"))
+    # build the hourly datetime index, historical data does not depend on a weather API
+    datetimes = _hourly_utc_range(start, end)
 
     # get the PV power output
-    response_dict = get_forecast_result_dict(
-        str(plant_name.name), pv_system_mngr, "historical", interval, weather_df
+    response_dict = await run_in_threadpool(
+        get_forecast_result_dict,
+        str(plant_name.name),
+        pv_system_mngr,
+        "historical",
+        interval,
+        datetimes,
     )
     return HistoricalModel(**response_dict)
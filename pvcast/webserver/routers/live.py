@@ -1,11 +1,13 @@
 """Contains the FastAPI router for the /live endpoint."""
 from __future__ import annotations
 
-import datetime as dt  # noqa: TCH003
-from typing import Any
+import datetime as dt
+from types import MappingProxyType  # noqa: TCH003
+from typing import TYPE_CHECKING
 
-import polars as pl
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from typing_extensions import Annotated
 
 from pvcast.model.model import PVSystemManager  # noqa: TCH001
@@ -22,15 +24,29 @@ from pvcast.webserver.routers.dependencies import (
 
 from .helpers import get_forecast_result_dict
 
-router = APIRouter()
+if TYPE_CHECKING:
+    import polars as pl
 
+router = APIRouter(default_response_class=ORJSONResponse)
 
-@router.get("/{plant_name}/{interval}/{weather_source}")
-def get(  # pylint: disable=too-many-arguments
+EPOCH = dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc)
+
+
+def _epoch_ms(timestamp: dt.datetime) -> int:
+    """Convert a datetime to milliseconds since the epoch. Naive datetimes are UTC."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=dt.timezone.utc)
+    return (timestamp - EPOCH) // dt.timedelta(milliseconds=1)
+
+
+@router.get("/{plant_name}/{interval}/{weather_source}", response_model=LiveModel)
+async def get(  # pylint: disable=too-many-arguments
     plant_name: PVPlantNames,
     weather_source: WeatherSources,
     pv_system_mngr: Annotated[PVSystemManager, Depends(get_pv_system_mngr)],
-    weather_apis: Annotated[tuple[WeatherAPI], Depends(get_weather_sources)],
+    weather_apis: Annotated[
+        MappingProxyType[str, WeatherAPI], Depends(get_weather_sources)
+    ],
     start: Annotated[
         dt.datetime | None,
         Query(
@@ -44,7 +60,7 @@ def get(  # pylint: disable=too-many-arguments
         ),
     ] = None,
     interval: Interval = Interval.H1,
-) -> LiveModel:
+) -> ORJSONResponse:
     """Get the estimated PV output power in Watts.
 
     Forecast is provided at interval <interval> for the given PV system <name>.
@@ -57,26 +73,44 @@ def get(  # pylint: disable=too-many-arguments
     :return: Estimated PV power output in Watts at the given interval <interval> for the given PV system <name>
     """
     # get the correct weather API from the list of weather APIs
-    weather_apis_f = filter(lambda api: api.name == weather_source.value, weather_apis)
-    weather_api: WeatherAPI = next(weather_apis_f)
+    try:
+        weather_api: WeatherAPI = weather_apis[weather_source.value]
+    except KeyError as exc:
+        msg = f"Weather source {weather_source.value} not found."
+        raise HTTPException(status_code=404, detail=msg) from exc
 
-    # convert dict to dataframe
-    weather_dict: dict[str, Any] = weather_api.get_weather(calc_irrads=True)
-    weather_df = pl.DataFrame(weather_dict["data"]).with_columns(
-        pl.col("datetime").str.to_datetime()
+    # get the weather data as a typed, columnar dataframe
+    weather_df: pl.DataFrame = await run_in_threadpool(
+        weather_api.get_weather_df, calc_irrads=True
     )
 
-    # filter weather data between start and end timestamps
+    # filter weather data between start and end timestamps, the weather API guarantees
+    # sorted datetimes so we can bisect instead of scanning the whole column
+    weather_df = weather_df.set_sorted("datetime")
+    epoch_ms = weather_df["datetime"].dt.epoch("ms").set_sorted()
+    lower, upper = 0, len(epoch_ms)
     if start is not None:
-        weather_df = weather_df.filter(weather_df["datetime"] >= start)
+        lower = epoch_ms.search_sorted(_epoch_ms(start), side="left")  # type: ignore[assignment]
     if end is not None:
-        weather_df = weather_df.filter(weather_df["datetime"] < end)
+        upper = epoch_ms.search_sorted(_epoch_ms(end), side="left")  # type: ignore[assignment]
+    weather_df = weather_df.slice(lower, max(upper - lower, 0))
 
     # get the PV power output
-    response_dict = get_forecast_result_dict(
-        str(plant_name.name), pv_system_mngr, "live", interval, weather_df
+    response_dict = await run_in_threadpool(
+        get_forecast_result_dict,
+        str(plant_name.name),
+        pv_system_mngr,
+        "live",
+        interval,
+        weather_df,
     )
 
-    # add weather source from weather_dict to response_dict
-    response_dict["weather_source"] = weather_dict["source"]
-    return LiveModel(**response_dict)
+    # add weather source to response_dict
+    response_dict["weather_source"] = weather_api.name
+
+    # the result is valid until the weather API fetches new data
+    max_age = max(weather_api.max_age - weather_api.dt_new_data, dt.timedelta(0))
+    cache_control = f"public, max-age={int(max_age.total_seconds())}"
+
+    # response_dict already has the shape of LiveModel, serialize it directly
+    return ORJSONResponse(response_dict, headers={"Cache-Control": cache_control})
@@ -1,15 +1,25 @@
 """Utilities for the webserver."""
 from __future__ import annotations
 
-from fastapi import APIRouter, Request
+import json
+
+from fastapi import APIRouter, Request, Response
 
 router = APIRouter()
 
 
-@router.get("/list_endpoints/")
-def list_endpoints(request: Request) -> list[dict[str, str]]:
+@router.get("/list_endpoints/", response_model=list[dict[str, str]])
+def list_endpoints(request: Request) -> Response:
     """List all endpoints.
 
+    Routes are static once the app is running, so the serialized endpoint list is
+    built on the first request and stored on the app state.
+
     :param request: The request
     """
-    return [{"path": route.path, "name": route.name} for route in request.app.routes]
+    state = request.app.state
+    if not hasattr(state, "endpoint_list"):
+        state.endpoint_list = json.dumps(
+            [{"path": route.path, "name": route.name} for route in request.app.routes]
+        ).encode()
+    return Response(content=state.endpoint_list, media_type="application/json")
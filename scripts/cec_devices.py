@@ -1,9 +1,10 @@
 """Script to retrieve CEC inverters and modules from PVLib and save them to CSV."""
 
 import logging
-import pathlib as pl
+from pathlib import Path
 
 import pandas as pd
+import polars as pl
 import pvlib
 from const import INV_PVLIB_PATH, MOD_PVLIB_PATH
 
@@ -20,18 +21,13 @@ def get_cec_modules() -> pd.DataFrame:
     return pvlib.pvsystem.retrieve_sam("CECMod")
 
 
-def save_to_csv(data: pd.DataFrame, path: pl.Path) -> None:
+def save_to_csv(data: pd.DataFrame, path: Path) -> None:
     """Save datafram to CSV file."""
-    cols = data.columns
-    data = data.transpose()
-    data["Name"] = cols
+    # devices are columns in data, transpose and move the device names to column "Name"
+    data = data.transpose().rename_axis("Name").reset_index()
 
-    # Move name to first column
-    names = data["Name"]
-    data = data.drop(labels=["Name"], axis=1)
-    data.insert(0, "Name", names)
-
-    data.to_csv(path, index=False)
+    # polars' multithreaded CSV writer is much faster than pandas' writer
+    pl.from_pandas(data.infer_objects()).write_csv(path)
 
 
 def main() -> None:
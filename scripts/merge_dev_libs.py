@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
-import pandas as pd
+import polars as pl
 import pvlib
 from const import (
     INV_PROC_PATH,
@@ -23,28 +23,27 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
-def retrieve_sam_wrapper(path: Path) -> pd.DataFrame:
+def retrieve_sam_wrapper(path: Path) -> pl.DataFrame:
     """Retrieve SAM database.
 
     :param path: The path to the SAM database.
-    :return: The SAM database as a pandas DataFrame.
+    :return: The SAM database as a polars DataFrame.
     """
     if not path.exists():
         msg = f"Database {path} does not exist."
         raise FileNotFoundError(msg)
 
-    # retrieve database
+    # retrieve database, pvlib returns pandas so convert once at the boundary
     pv_df = pvlib.pvsystem.retrieve_sam(name=None, path=str(path))
-    pv_df = pv_df.transpose()
-    return pv_df.reset_index()
+    return pl.from_pandas(pv_df.transpose().reset_index().infer_objects())
 
 
-def retrieve_and_merge(path1: Path, path2: Path) -> pd.DataFrame:
+def retrieve_and_merge(path1: Path, path2: Path) -> pl.DataFrame:
     """Retrieve SAM databases and merge them.
 
     :param path1: The first path to the SAM database.
     :param path2: The second path to the SAM database.
-    :return: The merged SAM databases as a pandas DataFrame.
+    :return: The merged SAM databases as a polars DataFrame.
     """
     df1 = retrieve_sam_wrapper(path1)
     _LOGGER.info("%s length: %s", path1.name, len(df1))
@@ -52,20 +51,18 @@ def retrieve_and_merge(path1: Path, path2: Path) -> pd.DataFrame:
     df2 = retrieve_sam_wrapper(path2)
     _LOGGER.info("%s length: %s", path2.name, len(df2))
 
-    # merge databases
-    merged_df = pd.concat([df1, df2], axis=0)
-
-    # drop duplicates
-    if merged_df.duplicated(subset=["index"]).any():
-        _LOGGER.info(
-            "Dropping %s duplicate entries for %s.",
-            len(merged_df[merged_df.duplicated(subset=["index"])]),
-            path1.name,
-        )
-        merged_df = merged_df.drop_duplicates(subset=["index"], keep="first")
-
-    # sort in alphabetical order
-    return merged_df.sort_values(by=["index"])
+    # merge databases, drop duplicates and sort in alphabetical order in one query. The
+    # databases come from different SAM releases, so align their columns by name and
+    # keep the union of them.
+    merged_df = (
+        pl.concat([df1.lazy(), df2.lazy()], how="diagonal_relaxed")
+        .unique(subset=["index"], keep="first", maintain_order=True)
+        .sort("index")
+        .collect()
+    )
+    if n_dropped := len(df1) + len(df2) - len(merged_df):
+        _LOGGER.info("Dropping %s duplicate entries for %s.", n_dropped, path1.name)
+    return merged_df
 
 
 def main() -> None:
@@ -87,13 +84,15 @@ def main() -> None:
     inv_df = retrieve_and_merge(INV_PVLIB_PATH, INV_SAM_PATH)
     mod_df = retrieve_and_merge(MOD_PVLIB_PATH, MOD_SAM_PATH)
 
-    # apply manual corrections
-    for key, value in MANUAL_CORRECTIONS_INV.items():
-        inv_df.loc[inv_df["index"] == key, list(value.keys())] = list(value.values())
+    # apply manual corrections in one aligned update instead of one mask per device
+    corrections = pl.DataFrame(
+        [{"index": name, **values} for name, values in MANUAL_CORRECTIONS_INV.items()]
+    )
+    inv_df = inv_df.update(corrections, on="index")
 
-    # save databases
-    inv_df.to_csv(INV_PROC_PATH, index=False)
-    mod_df.to_csv(MOD_PROC_PATH, index=False)
+    # save databases, pvcast caches a Parquet copy of them at runtime
+    inv_df.write_csv(INV_PROC_PATH)
+    mod_df.write_csv(MOD_PROC_PATH)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,11 @@
 """Test the configreader module."""
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from zoneinfo import ZoneInfoNotFoundError
 
 import pytest
-from pytz import UnknownTimeZoneError
 from yaml import ScalarNode, SequenceNode, YAMLError
 from yaml.loader import SafeLoader
 
@@ -91,7 +92,7 @@ class TestConfigReader:
 
     def test_invalid_timezone(self) -> None:
         """Test the configreader with an invalid timezone."""
-        with pytest.raises(UnknownTimeZoneError):
+        with pytest.raises(ZoneInfoNotFoundError):
             _ = ConfigReader(config_file_path=TEST_CONF_PATH_ERROR)
 
     def test_yaml_secrets_loader_scalar_node(
@@ -114,3 +115,34 @@ class TestConfigReader:
         node = SequenceNode(tag="tag:yaml.org,2002:seq", value=[])
         with pytest.raises(TypeError, match="Expected a ScalarNode"):
             configreader_secfile_sectags._yaml_secrets_loader(loader, node)
+
+    def test_configreader_reload_on_change(self, tmp_path: Path) -> None:
+        """Test that the config is only parsed again after the file changed."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(TEST_CONF_PATH_NO_SEC.read_text(encoding="utf-8"))
+        configreader = ConfigReader(config_path)
+        config = configreader.config
+        assert configreader.config is config
+
+        # touch the file with a new mtime, the config must be parsed again
+        mtime_ns = config_path.stat().st_mtime_ns + 1_000_000_000
+        os.utime(config_path, ns=(mtime_ns, mtime_ns))
+        assert configreader.config is not config
+        assert configreader.config["plant"][0]["name"] == "EastWest"
+
+    @pytest.mark.parametrize(
+        ("value", "expected"), [('"false"', False), ("false", False), ("true", True)]
+    )
+    def test_configreader_microinverter_boolean(
+        self, tmp_path: Path, value: str, *, expected: bool
+    ) -> None:
+        """Test that the microinverter flag is parsed as a boolean, also when quoted."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(
+            TEST_CONF_PATH_NO_SEC.read_text(encoding="utf-8").replace(
+                "microinverter: false", f"microinverter: {value}"
+            )
+        )
+        configreader = ConfigReader(config_path)
+        for plant in configreader.config["plant"]:
+            assert plant["microinverter"] is expected
@@ -2,20 +2,31 @@
 from __future__ import annotations
 
 import datetime as dt
+import re
 import secrets
+import shutil
 from pathlib import Path
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 from urllib.parse import urljoin
 
 import polars as pl
 import pytest
+import requests
 import responses
+from polars.testing import assert_frame_equal
 
-from pvcast.model.const import PVGIS_TMY_END, PVGIS_TMY_START, VALID_UPSAMPLE_FREQ
+from pvcast.model.const import (
+    PVGIS_ATTEMPTS,
+    PVGIS_TMY_END,
+    PVGIS_TMY_START,
+    VALID_UPSAMPLE_FREQ,
+)
 from pvcast.model.forecasting import (
     ForecastResult,
     ForecastType,
     PowerEstimate,
+    _clearsky_irradiance,
 )
 
 if TYPE_CHECKING:
@@ -198,6 +209,10 @@ class TestForecastResult:
         fc_ups: ForecastResult = forecast_result.upsample(frequency)
         assert fc_ups.frequency == expected
 
+        # the original result is left untouched
+        assert fc_ups is not forecast_result
+        assert forecast_result.frequency == 3600
+
     def test_upsample_invalid_frequency(self, forecast_result: ForecastResult) -> None:
         """Test that forecast result upsampling fails with invalid frequency."""
         with pytest.raises(ValueError, match="Invalid frequency"):
@@ -293,29 +308,6 @@ class TestForecastResult:
         ):
             forecast_result.energy("1h")
 
-    @pytest.mark.parametrize(
-        ("time_str", "expected"),
-        [
-            ("10s", 10),
-            ("10m", 600),
-            ("10h", 36000),
-            ("10d", 864000),
-            ("10x", ValueError),
-        ],
-    )
-    def testtime_str_to_seconds(
-        self,
-        forecast_result: ForecastResult,
-        time_str: str,
-        expected: int | type[Exception],
-    ) -> None:
-        """Test that forecast result time_str_to_seconds method works."""
-        if isinstance(expected, type) and issubclass(expected, Exception):
-            with pytest.raises(expected):
-                forecast_result.time_str_to_seconds(time_str)
-        else:
-            assert forecast_result.time_str_to_seconds(time_str) == expected
-
     @pytest.mark.parametrize("drop", [None, "temperature", "humidity"])
     def test_add_precipitable_water(
         self, pv_plant_model: PVPlantModel, weather_df: pl.DataFrame, drop: str | None
@@ -369,6 +361,68 @@ class TestForecastResult:
         assert "ac_power" in result.ac_power.columns
         assert result.ac_power["ac_power"].dtype == pl.Int64
 
+    def test_clearsky_irradiance_cached(
+        self, pv_plant_model: PVPlantModel, weather_df: pl.DataFrame
+    ) -> None:
+        """Test that clear sky irradiance is reused for the same datetimes."""
+        result1 = pv_plant_model.clearsky.run(weather_df)
+        hits = _clearsky_irradiance.cache_info().hits
+        result2 = pv_plant_model.clearsky.run(weather_df)
+        assert _clearsky_irradiance.cache_info().hits == hits + 1
+        assert result1.ac_power is not None
+        assert result1.ac_power.equals(result2.ac_power)  # type: ignore[arg-type]
+
+    def test_clearsky_irradiance_irregular_datetimes(
+        self, pv_plant_model: PVPlantModel, weather_df: pl.DataFrame
+    ) -> None:
+        """Test that irregular datetimes get the same irradiance as a regular range."""
+        regular = pv_plant_model.clearsky._prepare_weather(weather_df)
+        irregular_df = weather_df.gather_every(3).vstack(weather_df[1:2])
+        irregular = pv_plant_model.clearsky._prepare_weather(irregular_df)
+        expected = regular.join(irregular_df.select("datetime"), on="datetime")
+        assert_frame_equal(
+            irregular.sort("datetime").select(["ghi", "dni", "dhi"]),
+            expected.sort("datetime").select(["ghi", "dni", "dhi"]),
+        )
+
+    def test_power_run_no_irradiance(
+        self, pv_plant_model: PVPlantModel, weather_df: pl.DataFrame
+    ) -> None:
+        """Test that rows without irradiance match a simulation of every row."""
+        night = pl.arange(0, len(weather_df), eager=True) < 12
+        night_df = weather_df.with_columns(
+            pl.when(night).then(0.0).otherwise(pl.col(col)).alias(col)
+            for col in ("ghi", "dni", "dhi")
+        )
+        result = pv_plant_model.live.run(night_df)
+        with patch("pvcast.model.forecasting._daylight_mask", return_value=None):
+            expected = pv_plant_model.live.run(night_df)
+        assert result.ac_power is not None
+        assert expected.ac_power is not None
+        assert result.ac_power.equals(expected.ac_power)
+
+        # at night the inverters consume their night tare
+        assert (result.ac_power["ac_power"].filter(night) <= 0).all()
+
+    def test_power_run_nan_irradiance(
+        self, pv_plant_model: PVPlantModel, weather_df: pl.DataFrame
+    ) -> None:
+        """Test that missing irradiance is simulated and counts as no output."""
+        estimator = pv_plant_model.live
+        nan_df = weather_df.with_columns(
+            pl.when(pl.arange(0, len(weather_df)) == 20)
+            .then(float("nan"))
+            .otherwise(pl.col("ghi"))
+            .alias("ghi")
+        )
+        with patch.object(
+            estimator, "_run_model_chains", wraps=estimator._run_model_chains
+        ) as run_model_chains:
+            result = estimator.run(nan_df)
+        assert len(run_model_chains.call_args.args[0]) == len(nan_df)
+        assert result.ac_power is not None
+        assert result.ac_power["ac_power"][20] == 0
+
     @pytest.mark.parametrize(
         "fc_type",
         [
@@ -386,16 +440,25 @@ class TestForecastResult:
         with pytest.raises(ValueError, match="Must provide weather data."):
             _ = estimator.run(None)
 
+    @pytest.fixture
+    def pvgis_data_path(self, tmp_path: Path) -> Path:
+        """Return the path to the stored PVGIS test data in Parquet format."""
+        pl.read_csv(PVGIS_PROC_CSV).with_columns(
+            pl.col("datetime").str.to_datetime()
+        ).write_parquet(tmp_path / "pvgis.parquet")
+        return tmp_path / "pvgis.parquet"
+
     @pytest.mark.parametrize("use_weather_df", [True, False])
     def test_power_run_historical_data_present(
         self,
         pv_plant_model: PVPlantModel,
         weather_df: pl.DataFrame,
+        pvgis_data_path: Path,
         *,
         use_weather_df: bool,
     ) -> None:
         """Test the power estimate run method for historical data already present."""
-        pv_plant_model.historical._pvgis_data_path = Path(PVGIS_PROC_CSV)
+        pv_plant_model.historical._pvgis_data_path = pvgis_data_path
         result: ForecastResult
         if use_weather_df:
             result = pv_plant_model.historical.run(weather_df)
@@ -408,6 +471,58 @@ class TestForecastResult:
         assert "ac_power" in result.ac_power.columns
         assert result.ac_power["ac_power"].dtype == pl.Int64
 
+    def test_historical_tmy_data_cached(
+        self, pv_plant_model: PVPlantModel, pvgis_data_path: Path
+    ) -> None:
+        """Test that the PVGIS TMY data is parsed once and then reused."""
+        historical = pv_plant_model.historical
+        historical._pvgis_data_path = pvgis_data_path
+        tmy_data = historical._load_tmy_data()
+        assert tmy_data["datetime"].dtype == pl.Datetime("ms", "UTC")
+        assert historical._load_tmy_data() is tmy_data
+
+    def test_historical_legacy_csv_converted(
+        self, pv_plant_model: PVPlantModel, tmp_path: Path
+    ) -> None:
+        """Test that PVGIS data stored as CSV by older versions is converted to Parquet."""
+        shutil.copy(PVGIS_PROC_CSV, tmp_path / "pvgis.csv")
+        historical = pv_plant_model.historical
+        historical._pvgis_data_path = tmp_path / "pvgis.parquet"
+
+        # no requests are registered, so the PVGIS API must not be called
+        with responses.RequestsMock():
+            tmy_data = historical._load_tmy_data()
+        assert historical._pvgis_data_path.is_file()
+        assert tmy_data["datetime"].dtype == pl.Datetime("ms", "UTC")
+        assert len(tmy_data) == len(pl.read_csv(PVGIS_PROC_CSV))
+
+    @pytest.mark.parametrize(
+        ("status", "body", "n_requests"),
+        [
+            (400, '{"message": "Location over the sea."}', 1),
+            (503, "Service Unavailable", PVGIS_ATTEMPTS),
+        ],
+    )
+    def test_power_run_historical_pvgis_error(
+        self,
+        pv_plant_model: PVPlantModel,
+        tmp_path: Path,
+        status: int,
+        body: str,
+        n_requests: int,
+    ) -> None:
+        """Test that only transient PVGIS errors are retried."""
+        pv_plant_model.historical._pvgis_data_path = tmp_path / "pvgis.parquet"
+        with responses.RequestsMock() as rsps, patch(
+            "pvcast.model.forecasting.time.sleep"
+        ):
+            rsps.add(
+                responses.GET, re.compile(f"{EU_JRC_URL}.*"), body=body, status=status
+            )
+            with pytest.raises(requests.HTTPError):
+                pv_plant_model.historical.run(None)
+            assert len(rsps.calls) == n_requests
+
     def test_power_run_historical_data_missing(
         self,
         pv_plant_model: PVPlantModel,
@@ -417,7 +532,7 @@ class TestForecastResult:
         lat = str(round(pv_plant_model.location.latitude, 4))
         lon = str(round(pv_plant_model.location.longitude, 4))
         pv_plant_model.historical._pvgis_data_path = Path(
-            f"{PVGIS_TEMP_LOC}_{secrets.randbelow(100000)}.csv"
+            f"{PVGIS_TEMP_LOC}_{secrets.randbelow(100000)}.parquet"
         )
 
         with responses.RequestsMock() as rsps:
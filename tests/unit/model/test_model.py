@@ -1,6 +1,7 @@
 """Unit tests for the model module."""
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from types import MappingProxyType
 from typing import Any
@@ -10,7 +11,11 @@ import pytest
 from pvlib.location import Location
 
 from pvcast.model.forecasting import ForecastType
-from pvcast.model.model import PVSystemManager
+from pvcast.model.model import (
+    PVSystemManager,
+    _cec_cache_path,
+    _scan_cec_database,
+)
 
 
 class TestPVModelChain:
@@ -126,3 +131,68 @@ class TestPVModelChain:
         pvplant = pv_sys_mngr.get_pv_plant("EastWest")
         cs_result = pvplant.clearsky.run(weather_df)
         assert cs_result.fc_type == ForecastType.CLEARSKY
+
+    def test_scan_cec_database_prefers_parquet(self, tmp_path: Path) -> None:
+        """Test that a cached Parquet copy of the CEC database is preferred."""
+        csv_path = tmp_path / "cec_inverters.csv"
+        cache_dir = tmp_path / "cache"
+        pl.DataFrame({"index": ["csv_inverter"]}).write_csv(csv_path)
+        scanned = _scan_cec_database(csv_path, cache_dir)
+        assert scanned.collect()["index"][0] == "csv_inverter"
+        pl.DataFrame({"index": ["parquet_inverter"]}).write_parquet(
+            _cec_cache_path(csv_path, cache_dir)
+        )
+        scanned = _scan_cec_database(csv_path, cache_dir)
+        assert scanned.collect()["index"][0] == "parquet_inverter"
+
+        # the Parquet copy is never stored next to the CSV file
+        assert not csv_path.with_suffix(".parquet").exists()
+
+    def test_select_devices_drops_duplicates(self) -> None:
+        """Test that only the first database entry of each selected device is kept."""
+        params = pl.LazyFrame(
+            {"index": ["inv_a", "inv_b", "inv_a", "inv_c"], "Paco": [1, 2, 3, 4]}
+        )
+        selected = PVSystemManager._select_devices(params, ["inv_a", "inv_b"]).collect()
+        assert selected["index"].to_list() == ["inv_a", "inv_b"]
+        assert selected["Paco"].to_list() == [1, 2]
+
+    def test_forecast_types_have_own_model_chains(
+        self, pv_sys_mngr: PVSystemManager
+    ) -> None:
+        """Test that each forecast type runs its own model chains."""
+        pvplant = pv_sys_mngr.get_pv_plant("EastWest")
+        forecasts = (pvplant.clearsky, pvplant.live, pvplant.historical)
+        chain_ids = [id(mc) for fc in forecasts for mc in fc._model_chains]
+        assert len(chain_ids) == len(set(chain_ids))
+        n_inverters = sum(count for _, count in pvplant.pv_systems)
+        for forecast in forecasts:
+            assert len(forecast._model_chains) == len(pvplant.pv_systems)
+            assert forecast._chain_weights.sum() == n_inverters
+
+    def test_scan_cec_database_converts_csv(self, tmp_path: Path) -> None:
+        """Test that the CEC database CSV is converted to Parquet when it changes."""
+        csv_path = tmp_path / "cec_modules.csv"
+        cache_dir = tmp_path / "cache"
+        parquet_path = _cec_cache_path(csv_path, cache_dir)
+        pl.DataFrame({"index": ["module_a"]}).write_csv(csv_path)
+        scanned = _scan_cec_database(csv_path, cache_dir)
+        assert scanned.collect()["index"][0] == "module_a"
+        assert pl.read_parquet(parquet_path)["index"][0] == "module_a"
+
+        # a CSV file that is newer than its Parquet copy is converted again
+        pl.DataFrame({"index": ["module_b"]}).write_csv(csv_path)
+        mtime = parquet_path.stat().st_mtime
+        os.utime(csv_path, (mtime + 1, mtime + 1))
+        scanned = _scan_cec_database(csv_path, cache_dir)
+        assert scanned.collect()["index"][0] == "module_b"
+        assert pl.read_parquet(parquet_path)["index"][0] == "module_b"
+
+    def test_scan_cec_database_read_only_cache(self, tmp_path: Path) -> None:
+        """Test that the CEC database loads when its Parquet copy cannot be cached."""
+        csv_path = tmp_path / "cec_modules.csv"
+        cache_dir = tmp_path / "cache"
+        cache_dir.write_text("not a directory")
+        pl.DataFrame({"index": ["module_a"]}).write_csv(csv_path)
+        scanned = _scan_cec_database(csv_path, cache_dir)
+        assert scanned.collect()["index"][0] == "module_a"
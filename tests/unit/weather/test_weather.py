@@ -68,6 +68,15 @@ class CommonWeatherTests:
             assert "dni" in datapoint
             assert "dhi" in datapoint
 
+    @pytest.mark.parametrize("weather_api", [common_df], indirect=True)
+    def test_weather_data_df(self, weather_api: WeatherAPI) -> None:
+        """Test the get_weather_df function."""
+        weather_df = weather_api.get_weather_df(calc_irrads=True)
+        assert isinstance(weather_df, pl.DataFrame)
+        assert weather_df["datetime"].dtype == pl.Datetime("ms", "UTC")
+        assert {"ghi", "dni", "dhi"}.issubset(weather_df.columns)
+        assert len(weather_df) == len(weather_api.get_weather()["data"])
+
     @pytest.mark.parametrize(
         "weather_api_fix_loc", [common_df.select(pl.exclude("datetime"))], indirect=True
     )
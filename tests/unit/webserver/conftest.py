@@ -1,6 +1,7 @@
 """Webserver specific pytest setup."""
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 import pytest
@@ -29,7 +30,9 @@ def client_base() -> TestClient:
 @pytest.fixture
 def client(weather_api_fix_loc: WeatherAPI, pv_sys_mngr: PVSystemManager) -> TestClient:
     """Overwrite the weather sources dependency with a mock."""
-    app.dependency_overrides[get_weather_sources] = lambda: (weather_api_fix_loc,)
+    app.dependency_overrides[get_weather_sources] = lambda: MappingProxyType(
+        {weather_api_fix_loc.name: weather_api_fix_loc}
+    )
     app.dependency_overrides[get_pv_system_mngr] = lambda: pv_sys_mngr
     app.dependency_overrides[get_config_reader] = lambda: ConfigReader(
         TEST_CONF_PATH_NO_SEC
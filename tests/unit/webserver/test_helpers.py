@@ -1,5 +1,6 @@
 """Test webserver helper functions."""
 
+from unittest.mock import patch
 
 import polars as pl
 import pytest
@@ -7,6 +8,7 @@ from pvlib.location import Location
 
 from pvcast.model.model import PVSystemManager
 from pvcast.webserver.models.base import Interval
+from pvcast.webserver.routers import helpers
 from pvcast.webserver.routers.helpers import get_forecast_result_dict
 from tests.const import LOC_EUW
 
@@ -98,3 +100,93 @@ class TestWebserverHelpers:
             get_forecast_result_dict(
                 "South", pv_sys_mngr, "clearsky", Interval.H1, pl.DataFrame()
             )
+
+    @pytest.mark.parametrize("location", [LOC_EUW], indirect=True)
+    def test_get_forecast_result_dict_datetime_series(
+        self,
+        pv_sys_mngr: PVSystemManager,
+        weather_df: pl.DataFrame,
+        location: Location,  # noqa: ARG002 needed for indirect fixture
+    ) -> None:
+        """Test getting the forecast result dict with only a datetime series."""
+        response_dict = get_forecast_result_dict(
+            "South", pv_sys_mngr, "clearsky", Interval.H1, weather_df["datetime"]
+        )
+        assert len(response_dict["period"]) == len(weather_df)
+
+    @pytest.mark.parametrize("location", [LOC_EUW], indirect=True)
+    def test_get_forecast_result_dict_cached(
+        self,
+        pv_sys_mngr: PVSystemManager,
+        weather_df: pl.DataFrame,
+        location: Location,  # noqa: ARG002 needed for indirect fixture
+    ) -> None:
+        """Test that an identical request is served from the result cache."""
+        response_dict1 = get_forecast_result_dict(
+            "South", pv_sys_mngr, "clearsky", Interval.H1, weather_df
+        )
+        with patch.object(
+            pv_sys_mngr, "get_pv_plant", side_effect=AssertionError("not cached")
+        ):
+            response_dict2 = get_forecast_result_dict(
+                "South", pv_sys_mngr, "clearsky", Interval.H1, weather_df
+            )
+        assert response_dict1 == response_dict2
+        assert response_dict1 is not response_dict2
+
+        # adding a key to a returned result does not modify the cached result
+        response_dict2["weather_source"] = "test"
+        response_dict3 = get_forecast_result_dict(
+            "South", pv_sys_mngr, "clearsky", Interval.H1, weather_df
+        )
+        assert "weather_source" not in response_dict3
+
+    @pytest.mark.parametrize("location", [LOC_EUW], indirect=True)
+    def test_get_forecast_result_dict_cache_max_rows(
+        self,
+        pv_sys_mngr: PVSystemManager,
+        weather_df: pl.DataFrame,
+        location: Location,  # noqa: ARG002 needed for indirect fixture
+    ) -> None:
+        """Test that the result cache is bounded by its total number of rows."""
+        with patch.object(helpers, "RESULT_CACHE_MAX_ROWS", len(weather_df)):
+            helpers._result_cache.clear()
+            get_forecast_result_dict(
+                "South", pv_sys_mngr, "clearsky", Interval.H1, weather_df
+            )
+            get_forecast_result_dict(
+                "South", pv_sys_mngr, "clearsky", Interval.H1, weather_df[1:]
+            )
+            assert len(helpers._result_cache) == 1
+
+            # results larger than the cache are not stored at all
+            helpers._result_cache.clear()
+            get_forecast_result_dict(
+                "South", pv_sys_mngr, "clearsky", Interval.MIN30, weather_df
+            )
+            assert not helpers._result_cache
+
+    @pytest.mark.parametrize("location", [LOC_EUW], indirect=True)
+    def test_get_forecast_result_dict_cache_config_change(
+        self,
+        pv_sys_mngr: PVSystemManager,
+        weather_df: pl.DataFrame,
+        location: Location,  # noqa: ARG002 needed for indirect fixture
+    ) -> None:
+        """Test that the result cache is keyed on the PV plant configuration."""
+        _ = get_forecast_result_dict(
+            "South", pv_sys_mngr, "clearsky", Interval.H1, weather_df
+        )
+        changed_mngr = PVSystemManager(
+            pv_sys_mngr.config,
+            lat=pv_sys_mngr.location.latitude,
+            lon=pv_sys_mngr.location.longitude,
+            alt=pv_sys_mngr.location.altitude + 100.0,
+        )
+        with patch.object(
+            changed_mngr, "get_pv_plant", wraps=changed_mngr.get_pv_plant
+        ) as get_pv_plant:
+            get_forecast_result_dict(
+                "South", changed_mngr, "clearsky", Interval.H1, weather_df
+            )
+        get_pv_plant.assert_called()
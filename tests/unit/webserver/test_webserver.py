@@ -14,7 +14,9 @@ import pytest
 from fastapi.testclient import TestClient
 
 from pvcast.model.const import HISTORICAL_YEAR_MAPPING
+from pvcast.model.model import PVSystemManager
 from pvcast.webserver import app
+from pvcast.webserver.routers.dependencies import get_pv_system_mngr
 from tests.const import MOCK_WEATHER_API
 
 if TYPE_CHECKING:
@@ -75,6 +77,17 @@ class TestWebserver:
         assert response.headers["content-type"] == "application/json"
         assert len(response.json()) > 0
 
+    def test_get_list_endpoints_cached(
+        self,
+        client_base: TestClient,
+    ) -> None:
+        """Test that the endpoint list is built once and reused."""
+        response1 = client_base.get("/utils/list_endpoints/")
+        endpoint_list = client_base.app.state.endpoint_list  # type: ignore[attr-defined]
+        response2 = client_base.get("/utils/list_endpoints/")
+        assert client_base.app.state.endpoint_list is endpoint_list  # type: ignore[attr-defined]
+        assert response1.json() == response2.json()
+
     @patch.dict(os.environ, {"SOLARA_APP": "1"})
     @patch("fastapi.FastAPI", autospec=True)
     def test_solara_app_mounted(self, mock_app: MagicMock) -> None:
@@ -182,3 +195,46 @@ class TestHistorical(CommonForecastTests):
     """Test the historical API."""
 
     fc_type = "historical"
+
+    def test_get_forecast_cache_headers(
+        self,
+        client: TestClient,
+        interval: str,
+        plant_name: str,
+        weather_api_fix_loc: WeatherAPI,  # noqa: ARG002
+    ) -> None:
+        """Test that historical responses can be revalidated with their ETag."""
+        url = f"/{self.fc_type}/{plant_name}/{interval}"
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "public, max-age=3600"
+        etag = response.headers["etag"]
+
+        # a matching ETag is answered without a body
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert not response.content
+
+    def test_get_forecast_etag_config_change(
+        self,
+        client: TestClient,
+        interval: str,
+        plant_name: str,
+        pv_sys_mngr: PVSystemManager,
+    ) -> None:
+        """Test that a changed PV plant configuration invalidates the ETag."""
+        url = f"/{self.fc_type}/{plant_name}/{interval}"
+        etag = client.get(url).headers["etag"]
+
+        # same plants, different altitude
+        changed_mngr = PVSystemManager(
+            pv_sys_mngr.config,
+            lat=pv_sys_mngr.location.latitude,
+            lon=pv_sys_mngr.location.longitude,
+            alt=pv_sys_mngr.location.altitude + 100.0,
+        )
+        app.dependency_overrides[get_pv_system_mngr] = lambda: changed_mngr
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag